@@ -0,0 +1,282 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import asyncio
+import logging
+import os
+import shutil
+import signal
+from pathlib import Path
+from typing import Awaitable, Iterable, List, Optional, Tuple
+
+from smart_repository_manager_core.core.git_commands import GitCommandResult
+from smart_repository_manager_core.core.git_operations import (
+    PIPE_OPTIONS, SESSION_OPTIONS, GitCloneOperation, GitOperation, fetch_jobs_options
+)
+from smart_repository_manager_core.core.repo_index import repo_index
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGitOperation:
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+        self.process = None
+
+    async def _run(self, *args: str, timeout: int = 10) -> Tuple[int, str, str]:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        return process.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+    async def _communicate(self, *args: str) -> Tuple[str, str]:
+        self.process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **SESSION_OPTIONS,
+            **PIPE_OPTIONS
+        )
+
+        stdout, stderr = await asyncio.wait_for(self.process.communicate(), timeout=self.timeout)
+        return stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+    async def _verify_repository_health(self, repo_path: Path) -> bool:
+        try:
+            return_code, stdout, _ = await self._run('git', '-C', str(repo_path), 'rev-parse', '--git-dir', 'HEAD')
+            return return_code == 0 and len(stdout.split()) == 2
+        except Exception:
+            logger.debug("Health check failed for %s", repo_path, exc_info=True)
+            return False
+
+    def _get_auth_url(self, clone_url: str, token: str) -> str:
+        if not token:
+            return clone_url
+        return clone_url.replace('https://', f'https://oauth2:{token}@')
+
+    async def cancel(self) -> None:
+        if self.process is None or self.process.returncode is not None:
+            return
+
+        try:
+            pgid = os.getpgid(self.process.pid)
+            os.killpg(pgid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=GitOperation.TERMINATE_TIMEOUT)
+            except asyncio.TimeoutError:
+                os.killpg(pgid, signal.SIGKILL)
+                await self.process.wait()
+        except OSError:
+            logger.debug("Failed to terminate git process %s", self.process.pid, exc_info=True)
+
+
+class AsyncGitCloneOperation(AsyncGitOperation):
+
+    def __init__(self, timeout: int = 30, shallow: bool = False, partial: bool = False):
+        super().__init__(timeout)
+        self.shallow = shallow
+        self.partial = partial
+
+    async def execute(self, clone_url: str, target_path: Path, token: Optional[str] = None) -> GitCommandResult:
+        result = GitCommandResult()
+        temp_path = GitCloneOperation._get_temp_path(target_path)
+
+        try:
+            if temp_path.exists():
+                shutil.rmtree(temp_path)
+
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            auth_url = self._get_auth_url(clone_url, token) if token else clone_url
+
+            try:
+                stdout, stderr = await self._communicate(
+                    'git', 'clone', *GitCloneOperation._clone_options(self.shallow, self.partial),
+                    auth_url, str(temp_path)
+                )
+                result.return_code = self.process.returncode
+                result.output = stdout
+                result.error = stderr
+                result.success = self.process.returncode == 0
+
+                if result.success:
+                    if not self.shallow:
+                        await self._fetch_all_branches(temp_path)
+                    result.success = await self._verify_repository_health(temp_path)
+
+                    if result.success:
+                        GitCloneOperation._replace_target(temp_path, target_path)
+                        repo_index.invalidate(target_path)
+                        result.message = "Repository cloned successfully"
+
+            except asyncio.TimeoutError:
+                await self.cancel()
+                result.timed_out = True
+                result.error = f"Clone timeout after {self.timeout} seconds"
+                result.success = False
+
+        except Exception as e:
+            result.error = f"Clone error: {str(e)}"
+            result.success = False
+
+        finally:
+            self.process = None
+            if temp_path.exists():
+                shutil.rmtree(temp_path, ignore_errors=True)
+
+        return result
+
+    async def _fetch_all_branches(self, repo_path: Path) -> None:
+        try:
+            git_dir = str(repo_path / '.git')
+
+            await self._run('git', '--git-dir', git_dir, 'fetch', '--all', '--tags', *fetch_jobs_options(),
+                            timeout=60)
+            await self._run('git', '--git-dir', git_dir, 'config',
+                            '--add', 'remote.origin.fetch',
+                            '+refs/pull/*/head:refs/heads/pull/*')
+            await self._run('git', '--git-dir', git_dir, 'fetch', 'origin', timeout=60)
+
+        except Exception as e:
+            logger.warning("Failed to fetch all branches: %s", e)
+
+    def run(self, clone_url: str, target_path: Path, token: Optional[str] = None) -> GitCommandResult:
+        return asyncio.run(self.execute(clone_url, target_path, token))
+
+
+class AsyncGitPullOperation(AsyncGitOperation):
+
+    def __init__(self, timeout: int = 30, unshallow: bool = False):
+        super().__init__(timeout)
+        self.unshallow = unshallow
+
+    async def execute(self, repo_path: Path, token: Optional[str] = None) -> GitCommandResult:
+        result = GitCommandResult()
+
+        try:
+            if not repo_path.exists():
+                result.error = "Repository path does not exist"
+                return result
+
+            if not (repo_path / '.git').exists():
+                result.error = "Not a git repository"
+                return result
+
+            if token:
+                await self._update_remote_url_with_token(repo_path, token)
+
+            fetch_result = await self._fetch_repository(repo_path)
+            if not fetch_result.success:
+                return fetch_result
+
+            return_code, stdout, _ = await self._run(
+                'git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD', timeout=5
+            )
+
+            branch = "main"
+            if return_code == 0:
+                branch = stdout.strip()
+
+            try:
+                stdout, stderr = await self._communicate('git', '-C', str(repo_path), 'pull', 'origin', branch)
+                result.return_code = self.process.returncode
+                result.output = stdout
+                result.error = stderr
+                result.success = self.process.returncode == 0
+
+                if result.success:
+                    result.success = await self._verify_repository_health(repo_path)
+                    if result.success:
+                        repo_index.invalidate(repo_path)
+                        if "Already up to date" in stdout:
+                            result.message = "Already up to date"
+                        else:
+                            result.message = "Repository updated successfully"
+
+            except asyncio.TimeoutError:
+                await self.cancel()
+                result.timed_out = True
+                result.error = f"Pull timeout after {self.timeout} seconds"
+                result.success = False
+
+        except Exception as e:
+            result.error = f"Pull error: {str(e)}"
+            result.success = False
+
+        finally:
+            self.process = None
+
+        return result
+
+    async def _fetch_repository(self, repo_path: Path) -> GitCommandResult:
+        result = GitCommandResult()
+
+        try:
+            args = ['git', '-C', str(repo_path), 'fetch', '--all', '--prune', '--tags', *fetch_jobs_options()]
+            if self.unshallow and (repo_path / '.git' / 'shallow').exists():
+                args.append('--unshallow')
+
+            return_code, stdout, stderr = await self._run(*args, timeout=self.timeout)
+
+            result.return_code = return_code
+            result.output = stdout
+            result.error = stderr
+            result.success = return_code == 0
+
+            if not result.success:
+                result.error = f"Fetch failed: {stderr}"
+
+        except Exception as e:
+            result.success = False
+            result.error = f"Fetch error: {str(e)}"
+
+        return result
+
+    async def _update_remote_url_with_token(self, repo_path: Path, token: str) -> bool:
+        try:
+            return_code, stdout, _ = await self._run(
+                'git', '-C', str(repo_path), 'remote', 'get-url', 'origin', timeout=5
+            )
+
+            if return_code != 0:
+                return False
+
+            current_url = stdout.strip()
+
+            if current_url.startswith('https://') and 'oauth2:' not in current_url:
+                auth_url = current_url.replace('https://', f'https://oauth2:{token}@')
+                await self._run('git', '-C', str(repo_path), 'remote', 'set-url', 'origin', auth_url, timeout=5)
+                return True
+
+        except Exception as e:
+            logger.warning("Failed to update remote URL: %s", e)
+
+        return False
+
+    def run(self, repo_path: Path, token: Optional[str] = None) -> GitCommandResult:
+        return asyncio.run(self.execute(repo_path, token))
+
+
+async def run_batch(operations: Iterable[Awaitable[GitCommandResult]],
+                    concurrency: int = 8) -> List[GitCommandResult]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(operation: Awaitable[GitCommandResult]) -> GitCommandResult:
+        async with semaphore:
+            return await operation
+
+    return await asyncio.gather(*(_bounded(operation) for operation in operations))
+
+
+def execute_batch(operations: Iterable[Awaitable[GitCommandResult]],
+                  concurrency: int = 8) -> List[GitCommandResult]:
+    return asyncio.run(run_batch(operations, concurrency))
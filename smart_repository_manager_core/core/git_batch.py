@@ -0,0 +1,74 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import subprocess
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class GitBatchReader:
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self.process = None
+
+    def __enter__(self) -> 'GitBatchReader':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self.process is None:
+            self.process = subprocess.Popen(
+                ['git', '-C', str(self.repo_path), 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+            self.process.wait()
+        finally:
+            self.process.stdout.close()
+            self.process = None
+
+    def read_object(self, rev: str) -> Optional[Tuple[str, str, bytes]]:
+        self.open()
+
+        try:
+            self.process.stdin.write(rev.encode('utf-8') + b'\n')
+            self.process.stdin.flush()
+
+            header = self.process.stdout.readline().split()
+            if len(header) != 3:
+                return None
+
+            object_hash, object_type, size = header
+            content = self.process.stdout.read(int(size))
+            self.process.stdout.read(1)
+
+            return object_hash.decode('ascii'), object_type.decode('ascii'), content
+        except (OSError, ValueError):
+            return None
+
+    def read_head_commit(self) -> Optional[Tuple[str, int]]:
+        head = self.read_object('HEAD')
+        if head is None or head[1] != 'commit':
+            return None
+
+        commit_hash, _, content = head
+        for line in content.split(b'\n'):
+            if not line:
+                break
+            if line.startswith(b'committer '):
+                return commit_hash, int(line.rsplit(b' ', 2)[1])
+
+        return None
@@ -2,12 +2,15 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class GitCommandResult:
     success: bool = False
     output: str = ""
     error: str = ""
+    message: str = ""
     return_code: int = 0
     timed_out: bool = False
 
@@ -16,7 +19,7 @@ class GitCommandResult:
         return f"GitCommandResult({status}, code={self.return_code})"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GitOperationStatus:
     operation: str
     repo_name: str
@@ -1,17 +1,49 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
 import os
 import shutil
 import subprocess
 import signal
+import sys
 import time
 import random
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from smart_repository_manager_core.core.git_commands import GitCommandResult
+from smart_repository_manager_core.core.git_process_pool import GitProcessPool
+from smart_repository_manager_core.core.repo_index import repo_index
+
+logger = logging.getLogger(__name__)
+
+PIPE_OPTIONS = {'pipesize': 1 << 18} if sys.platform == 'linux' and sys.version_info >= (3, 10) else {}
+SESSION_OPTIONS = {'process_group': 0} if sys.version_info >= (3, 11) else {'start_new_session': True}
+FETCH_JOBS = 8
+FETCH_JOBS_MIN_VERSION = (2, 24)
+
+
+@lru_cache(maxsize=1)
+def fetch_jobs_options() -> Tuple[str, ...]:
+    try:
+        result = subprocess.run(
+            ['git', '--version'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5
+        )
+        match = re.search(r'(\d+)\.(\d+)', result.stdout)
+        if match and (int(match.group(1)), int(match.group(2))) >= FETCH_JOBS_MIN_VERSION:
+            return (f'--jobs={FETCH_JOBS}',)
+    except (OSError, subprocess.SubprocessError):
+        logger.debug("Failed to detect git version", exc_info=True)
+    return ()
 
 
 class GitOperation:
+    TERMINATE_TIMEOUT = 2
 
     def __init__(self, timeout: int = 30, max_retries: int = 3):
         self.timeout = timeout
@@ -21,39 +53,39 @@ class GitOperation:
         self.MAX_DELAY = 60
 
     def _terminate_process(self) -> None:
-        if self.process:
-            try:
-                os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
-                self.process.wait(timeout=5)
-            except Exception as e:
-                print(e)
-                try:
-                    os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
-                except Exception as e:
-                    print(e)
-                    pass
+        if not self.process or self.process.poll() is not None:
+            return
 
-    def _verify_repository_health(self, repo_path: Path) -> bool:
         try:
-            result1 = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-parse', '--git-dir'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=10
-            )
+            pgid = os.getpgid(self.process.pid)
+            os.killpg(pgid, signal.SIGTERM)
+
+            delay = 0.01
+            deadline = time.monotonic() + self.TERMINATE_TIMEOUT
+            while self.process.poll() is None and time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+            if self.process.poll() is None:
+                os.killpg(pgid, signal.SIGKILL)
+                self.process.wait()
+        except OSError:
+            logger.debug("Failed to terminate git process %s", self.process.pid, exc_info=True)
 
-            result2 = subprocess.run(
-                ['git', '-C', str(repo_path), 'log', '--oneline', '-1'],
+    def _verify_repository_health(self, repo_path: Path) -> bool:
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(repo_path), 'rev-parse', '--git-dir', 'HEAD'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=10
             )
 
-            return result1.returncode == 0 and result2.returncode == 0
-        except Exception as e:
-            print(e)
+            lines = result.stdout.split()
+            return result.returncode == 0 and len(lines) == 2
+        except Exception:
+            logger.debug("Health check failed for %s", repo_path, exc_info=True)
             return False
 
     def _get_auth_url(self, clone_url: str, token: str) -> str:
@@ -86,26 +118,41 @@ class GitOperation:
 
 class GitCloneOperation(GitOperation):
 
+    def __init__(self, timeout: int = 30, max_retries: int = 3, shallow: bool = False, partial: bool = False):
+        super().__init__(timeout, max_retries)
+        self.shallow = shallow
+        self.partial = partial
+
+    @staticmethod
+    def _clone_options(shallow: bool, partial: bool) -> List[str]:
+        options = []
+        if partial:
+            options.append('--filter=blob:none')
+        if shallow:
+            options.extend(['--depth=1', '--no-tags'])
+        return options
+
     def execute(self, clone_url: str, target_path: Path, token: Optional[str] = None) -> GitCommandResult:
         result = GitCommandResult()
+        temp_path = self._get_temp_path(target_path)
 
         try:
-            if target_path.exists():
-                shutil.rmtree(target_path)
+            if temp_path.exists():
+                shutil.rmtree(temp_path)
 
             target_path.parent.mkdir(parents=True, exist_ok=True)
 
             auth_url = self._get_auth_url(clone_url, token) if token else clone_url
 
-            cmd = ['git', 'clone', auth_url, str(target_path)]
+            cmd = ['git', 'clone', *self._clone_options(self.shallow, self.partial), auth_url, str(temp_path)]
 
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 encoding='utf-8',
-                start_new_session=True
+                **SESSION_OPTIONS,
+                **PIPE_OPTIONS
             )
 
             try:
@@ -116,12 +163,13 @@ class GitCloneOperation(GitOperation):
                 result.success = self.process.returncode == 0
 
                 if result.success:
-                    self._fetch_all_branches(target_path)
-                    result.success = self._verify_repository_health(target_path)
+                    if not self.shallow:
+                        self._fetch_all_branches(temp_path)
+                    result.success = self._verify_repository_health(temp_path)
 
-                    if not result.success:
-                        shutil.rmtree(target_path, ignore_errors=True)
-                    else:
+                    if result.success:
+                        self._replace_target(temp_path, target_path)
+                        repo_index.invalidate(target_path)
                         result.message = "Repository cloned successfully"
 
             except subprocess.TimeoutExpired:
@@ -129,29 +177,47 @@ class GitCloneOperation(GitOperation):
                 result.timed_out = True
                 result.error = f"Clone timeout after {self.timeout} seconds"
                 result.success = False
-                if target_path.exists():
-                    shutil.rmtree(target_path, ignore_errors=True)
 
         except Exception as e:
             result.error = f"Clone error: {str(e)}"
             result.success = False
-            if target_path.exists():
-                shutil.rmtree(target_path, ignore_errors=True)
 
         finally:
             self.process = None
+            if temp_path.exists():
+                shutil.rmtree(temp_path, ignore_errors=True)
 
         return result
 
+    def execute_batch(self, operations: Iterable[Tuple[str, Path, Optional[str]]],
+                      max_workers: Optional[int] = None) -> List[GitCommandResult]:
+        with GitProcessPool(max_workers) as pool:
+            return pool.map(self._execute_copy, operations)
+
+    def _execute_copy(self, clone_url: str, target_path: Path, token: Optional[str] = None) -> GitCommandResult:
+        operation = type(self)(self.timeout, self.max_retries, self.shallow, self.partial)
+        return operation.execute(clone_url, target_path, token)
+
+    @staticmethod
+    def _get_temp_path(target_path: Path) -> Path:
+        return target_path.with_name(f"{target_path.name}.tmp-{os.getpid()}")
+
+    @staticmethod
+    def _replace_target(temp_path: Path, target_path: Path) -> None:
+        if target_path.exists():
+            shutil.rmtree(target_path, ignore_errors=True)
+        os.rename(temp_path, target_path)
+
     def _fetch_all_branches(self, repo_path: Path) -> None:
         try:
             git_dir = repo_path / '.git'
 
             subprocess.run(
-                ['git', '--git-dir', str(git_dir), 'fetch', '--all', '--tags'],
+                ['git', '--git-dir', str(git_dir), 'fetch', '--all', '--tags', *fetch_jobs_options()],
                 check=False,
                 timeout=60,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
 
             try:
@@ -161,23 +227,29 @@ class GitCloneOperation(GitOperation):
                      '+refs/pull/*/head:refs/heads/pull/*'],
                     check=False,
                     timeout=10,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
                 subprocess.run(
                     ['git', '--git-dir', str(git_dir), 'fetch', 'origin'],
                     check=False,
                     timeout=60,
-                    capture_output=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
             except:
                 pass
 
         except Exception as e:
-            print(f"Warning: Failed to fetch all branches: {e}")
+            logger.warning("Failed to fetch all branches: %s", e)
 
 
 class GitPullOperation(GitOperation):
 
+    def __init__(self, timeout: int = 30, max_retries: int = 3, unshallow: bool = False):
+        super().__init__(timeout, max_retries)
+        self.unshallow = unshallow
+
     def execute(self, repo_path: Path, token: Optional[str] = None) -> GitCommandResult:
         result = GitCommandResult()
 
@@ -215,9 +287,9 @@ class GitPullOperation(GitOperation):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 encoding='utf-8',
-                start_new_session=True
+                **SESSION_OPTIONS,
+                **PIPE_OPTIONS
             )
 
             try:
@@ -230,6 +302,7 @@ class GitPullOperation(GitOperation):
                 if result.success:
                     result.success = self._verify_repository_health(repo_path)
                     if result.success:
+                        repo_index.invalidate(repo_path)
                         if "Already up to date" in stdout:
                             result.message = "Already up to date"
                         else:
@@ -254,7 +327,9 @@ class GitPullOperation(GitOperation):
         result = GitCommandResult()
 
         try:
-            cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--prune', '--tags']
+            cmd = ['git', '-C', str(repo_path), 'fetch', '--all', '--prune', '--tags', *fetch_jobs_options()]
+            if self.unshallow and (repo_path / '.git' / 'shallow').exists():
+                cmd.append('--unshallow')
 
             fetch_process = subprocess.run(
                 cmd,
@@ -304,7 +379,7 @@ class GitPullOperation(GitOperation):
                 return True
 
         except Exception as e:
-            print(f"Warning: Failed to update remote URL: {e}")
+            logger.warning("Failed to update remote URL: %s", e)
 
         return False
 
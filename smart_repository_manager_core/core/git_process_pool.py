@@ -0,0 +1,35 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class GitProcessPool:
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='git')
+
+    def __enter__(self) -> 'GitProcessPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+    def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        with self._slots:
+            return func(*args, **kwargs)
+
+    def submit(self, func: Callable[..., T], *args, **kwargs) -> 'Future[T]':
+        return self._executor.submit(self.run, func, *args, **kwargs)
+
+    def map(self, func: Callable[..., T], items: Iterable) -> List[T]:
+        futures = [self.submit(func, *item) for item in items]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -1,66 +1,62 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+from smart_repository_manager_core.core.git_batch import GitBatchReader
+from smart_repository_manager_core.core.repo_index import repo_index
+from smart_repository_manager_core.utils.helpers import Helpers
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+logger = logging.getLogger(__name__)
 
 
 class GitStatusChecker:
 
     @staticmethod
-    def get_local_commit_date(repo_path: Path) -> Optional[datetime]:
+    def get_local_commit_timestamp(repo_path: Path, use_index: bool = False) -> Optional[int]:
         try:
-            check_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-parse', '--verify', 'HEAD'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=10
-            )
+            head = GitStatusChecker._read_head(repo_path, use_index)
 
-            if check_result.returncode != 0:
+            if head is None:
                 return None
-
-            cmd = ['git', '-C', str(repo_path), 'log', '-1', '--format=%cI']
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                date_line = result.stdout.strip().split('\n')[0]
-                if date_line:
-                    date_str_clean = date_line.replace(' +', '+').replace(' -', '-')
-                    return datetime.fromisoformat(date_str_clean)
+            return head[1]
+        except Exception:
+            logger.debug("Failed to read local commit for %s", repo_path, exc_info=True)
             return None
-        except Exception as e:
-            print(e)
+
+    @staticmethod
+    def get_local_commit_date(repo_path: Path, use_index: bool = False) -> Optional[datetime]:
+        timestamp = GitStatusChecker.get_local_commit_timestamp(repo_path, use_index)
+        if timestamp is None:
             return None
+        return datetime.fromtimestamp(timestamp, timezone.utc)
 
     @staticmethod
-    def needs_update(repo_path: Path, github_pushed_at: str) -> bool:
+    def needs_update(repo_path: Path, github_pushed_at: str, use_index: bool = False) -> bool:
         try:
             if not repo_path.exists() or not (repo_path / '.git').exists():
                 return True
 
-            local_date = GitStatusChecker.get_local_commit_date(repo_path)
-            if not local_date:
-                return True
+            github_timestamp = Helpers.parse_github_date(github_pushed_at).timestamp()
 
-            github_date = datetime.fromisoformat(github_pushed_at.replace('Z', '+00:00'))
+            if GitStatusChecker._fetched_since(repo_path, github_timestamp):
+                return False
 
-            if local_date.tzinfo is None:
-                local_date_utc = local_date.replace(tzinfo=timezone.utc)
-            else:
-                local_date_utc = local_date.astimezone(timezone.utc)
+            head = GitStatusChecker._read_head(repo_path, use_index)
 
-            github_date_utc = github_date.replace(tzinfo=timezone.utc)
+            if head is None:
+                return True
 
-            time_diff = github_date_utc - local_date_utc
-            diff_seconds = time_diff.total_seconds()
+            local_hash, local_timestamp = head
+
+            diff_seconds = github_timestamp - local_timestamp
 
             if diff_seconds <= 300:
                 return False
@@ -68,38 +64,84 @@ class GitStatusChecker:
             remote_result = subprocess.run(
                 ['git', '-C', str(repo_path), 'ls-remote', 'origin', 'HEAD'],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
 
             if remote_result.returncode != 0:
                 return True
 
-            remote_data = remote_result.stdout.strip()
+            remote_data = remote_result.stdout.decode('ascii').strip()
             if not remote_data:
                 return True
 
             remote_hash = remote_data.split()[0]
 
-            local_hash_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-parse', 'HEAD'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=3
-            )
-
-            if local_hash_result.returncode != 0:
-                return True
-
-            local_hash = local_hash_result.stdout.strip()
-
             return local_hash != remote_hash
 
         except Exception:
             return True
 
+    @staticmethod
+    def _fetched_since(repo_path: Path, timestamp: float) -> bool:
+        git_dir = repo_path / '.git'
+        try:
+            fetch_head = git_dir / 'FETCH_HEAD'
+            if fetch_head.stat().st_mtime < timestamp:
+                return False
+
+            with open(fetch_head, 'rb') as f:
+                fetched = f.readline().split(b'\t', 1)[0].strip().decode('ascii')
+        except (OSError, UnicodeDecodeError):
+            return False
+
+        return bool(fetched) and fetched == GitStatusChecker._resolve_head(git_dir)
+
+    @staticmethod
+    def _resolve_head(git_dir: Path) -> Optional[str]:
+        try:
+            head = (git_dir / 'HEAD').read_text(encoding='ascii').strip()
+            if not head.startswith('ref: '):
+                return head
+
+            ref = head[len('ref: '):]
+            try:
+                return (git_dir / ref).read_text(encoding='ascii').strip()
+            except FileNotFoundError:
+                pass
+
+            with open(git_dir / 'packed-refs', encoding='ascii') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[1] == ref:
+                        return parts[0]
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        return None
+
+    @staticmethod
+    def _read_head(repo_path: Path, use_index: bool) -> Optional[Tuple[str, int]]:
+        if use_index:
+            entry = repo_index.get(repo_path)
+            if entry is None:
+                return None
+            return entry.head_hash, entry.commit_timestamp
+
+        if pygit2 is not None:
+            return GitStatusChecker._read_head_in_process(repo_path)
+
+        with GitBatchReader(repo_path) as reader:
+            return reader.read_head_commit()
+
+    @staticmethod
+    def _read_head_in_process(repo_path: Path) -> Optional[Tuple[str, int]]:
+        try:
+            commit = pygit2.Repository(str(repo_path)).head.peel(pygit2.Commit)
+            return str(commit.id), commit.commit_time
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+
     @staticmethod
     def repository_exists(repo_path: Path) -> bool:
         return repo_path.exists() and (repo_path / '.git').exists()
@@ -110,14 +152,14 @@ class GitStatusChecker:
             result = subprocess.run(
                 ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
 
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+            branch = result.stdout.decode('utf-8').strip()
+            if result.returncode == 0 and branch:
+                return branch
             return None
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.debug("Failed to read current branch for %s", repo_path, exc_info=True)
             return None
@@ -0,0 +1,82 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import copy
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from smart_repository_manager_core.utils.file_ops import FileOperations
+
+
+class HealthCache:
+    TTL = 600
+    FILENAME = "health.json"
+
+    def __init__(self, cache_dir: Path):
+        self.path = cache_dir / self.FILENAME
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def get(self, repo_path: Path) -> Optional[Dict[str, Any]]:
+        key = self._key(repo_path)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._load().get(repo_path.name)
+
+        if entry is None or entry.get("key") != key:
+            return None
+
+        if time.time() - entry.get("checked_at", 0) > self.TTL:
+            return None
+
+        return copy.deepcopy(entry["result"])
+
+    def put(self, repo_path: Path, result: Dict[str, Any]) -> None:
+        key = self._key(repo_path)
+        if key is None:
+            return
+
+        with self._lock:
+            self._load()[repo_path.name] = {
+                "key": key,
+                "checked_at": time.time(),
+                "result": copy.deepcopy(result)
+            }
+            self._dirty = True
+
+    def invalidate(self, repo_path: Path) -> None:
+        with self._lock:
+            if self._load().pop(repo_path.name, None) is not None:
+                self._dirty = True
+
+    def flush(self) -> bool:
+        with self._lock:
+            if not self._dirty:
+                return True
+            self._dirty = not FileOperations.write_json(self.path, self._entries)
+            return not self._dirty
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            data, ok = FileOperations.read_json(self.path)
+            self._entries = data if ok and isinstance(data, dict) else {}
+        return self._entries
+
+    @staticmethod
+    def _key(repo_path: Path) -> Optional[List[int]]:
+        git_dir = repo_path / '.git'
+        try:
+            head_mtime = os.stat(git_dir / 'HEAD').st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            index_mtime = os.stat(git_dir / 'index').st_mtime_ns
+        except OSError:
+            index_mtime = 0
+
+        return [index_mtime, head_mtime]
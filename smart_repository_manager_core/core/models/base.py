@@ -0,0 +1,12 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
+from dataclasses import fields
+from operator import attrgetter
+from typing import Callable, Tuple
+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def fields_getter(cls, exclude: Tuple[str, ...] = ()) -> Tuple[Tuple[str, ...], Callable]:
+    names = tuple(f.name for f in fields(cls) if f.name not in exclude)
+    return names, attrgetter(*names)
@@ -3,8 +3,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS, fields_getter
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class AppConfig:
     app_name: str = "Smart Repository Manager"
     version: str = "1.0.0"
@@ -12,10 +14,6 @@ class AppConfig:
     active_user: Optional[str] = None
     users: Dict[str, str] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.last_launch is None:
-            self.last_launch = datetime.now().isoformat()
-
     def set_version(self, version: str = "1.0.0"):
         self.version = str(version)
 
@@ -45,20 +43,18 @@ class AppConfig:
         self.last_launch = datetime.now().isoformat()
 
     def to_dict(self) -> Dict:
-        return {
-            "app_name": self.app_name,
-            "version": self.version,
-            "last_launch": self.last_launch,
-            "active_user": self.active_user,
-            "users": self.users
-        }
+        return dict(zip(_FIELD_NAMES, _get_fields(self)))
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'AppConfig':
+        get = data.get
         return cls(
-            app_name=data.get("app_name", "Smart Repository Manager"),
-            version=data.get("version", "1.0.0"),
-            last_launch=data.get("last_launch"),
-            active_user=data.get("active_user"),
-            users=data.get("users", {})
+            app_name=get("app_name", "Smart Repository Manager"),
+            version=get("version", "1.0.0"),
+            last_launch=get("last_launch") or datetime.now().isoformat(),
+            active_user=get("active_user"),
+            users=get("users", {})
         )
+
+
+_FIELD_NAMES, _get_fields = fields_getter(AppConfig)
@@ -1,11 +1,19 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+import os
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from sys import intern
+from typing import List, Optional, Dict, Any, Iterable
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS, fields_getter
+from smart_repository_manager_core.utils.helpers import Helpers
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Repository:
     id: int
     name: str
@@ -44,23 +52,13 @@ class Repository:
     def last_update(self) -> str:
         if not self.pushed_at:
             return "Unknown"
-        try:
-            dt = datetime.fromisoformat(self.pushed_at.replace('Z', '+00:00'))
-            return dt.strftime("%Y-%m-%d")
-        except Exception as e:
-            print(e)
-            return "Invalid date"
+        return _format_date(self.pushed_at)
 
     @property
     def created_date(self) -> str:
         if not self.created_at:
             return "Unknown"
-        try:
-            dt = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
-            return dt.strftime("%Y-%m-%d")
-        except Exception as e:
-            print(e)
-            return "Invalid date"
+        return _format_date(self.created_at)
 
     @property
     def size_mb(self) -> float:
@@ -89,69 +87,75 @@ class Repository:
             if git_dir.exists() and git_dir.is_dir():
                 self.local_exists = True
 
+    @classmethod
+    def update_local_status_batch(cls, repos: Iterable['Repository'], repos_path: Path) -> None:
+        try:
+            with os.scandir(repos_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
+
+        for repo in repos:
+            entry = entries.get(repo.name)
+            repo.local_exists = (
+                entry is not None
+                and entry.is_dir()
+                and os.path.isdir(os.path.join(entry.path, '.git'))
+            )
+
     def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "full_name": self.full_name,
-            "html_url": self.html_url,
-            "description": self.description,
-            "language": self.language,
-            "stargazers_count": self.stargazers_count,
-            "forks_count": self.forks_count,
-            "watchers_count": self.watchers_count,
-            "topics": self.topics,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "pushed_at": self.pushed_at,
-            "size": self.size,
-            "archived": self.archived,
-            "private": self.private,
-            "fork": self.fork,
-            "license": self.license,
-            "default_branch": self.default_branch,
-            "open_issues_count": self.open_issues_count,
-            "has_issues": self.has_issues,
-            "has_projects": self.has_projects,
-            "has_wiki": self.has_wiki,
-            "has_pages": self.has_pages,
-            "homepage": self.homepage,
-            "ssh_url": self.ssh_url,
-            "clone_url": self.clone_url,
-            "local_exists": self.local_exists,
-            "need_update": self.need_update
-        }
+        return dict(zip(_FIELD_NAMES, _get_fields(self)))
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Repository':
+        get = data.get
+        language = get('language')
         return cls(
-            id=data.get('id', 0),
-            name=data.get('name', ''),
-            full_name=data.get('full_name', ''),
-            html_url=data.get('html_url', ''),
-            description=data.get('description'),
-            language=data.get('language'),
-            stargazers_count=data.get('stargazers_count', 0),
-            forks_count=data.get('forks_count', 0),
-            watchers_count=data.get('watchers_count', 0),
-            topics=data.get('topics', []),
-            created_at=data.get('created_at'),
-            updated_at=data.get('updated_at'),
-            pushed_at=data.get('pushed_at'),
-            size=data.get('size', 0),
-            archived=data.get('archived', False),
-            private=data.get('private', False),
-            fork=data.get('fork', False),
-            license=data.get('license'),
-            default_branch=data.get('default_branch', 'main'),
-            open_issues_count=data.get('open_issues_count', 0),
-            has_issues=data.get('has_issues', False),
-            has_projects=data.get('has_projects', False),
-            has_wiki=data.get('has_wiki', False),
-            has_pages=data.get('has_pages', False),
-            homepage=data.get('homepage'),
-            ssh_url=data.get('ssh_url'),
-            clone_url=data.get('clone_url'),
-            local_exists=data.get('local_exists', False),
-            need_update=data.get('need_update', True)
+            id=get('id', 0),
+            name=get('name', ''),
+            full_name=get('full_name', ''),
+            html_url=get('html_url', ''),
+            description=get('description'),
+            language=intern(language) if language else None,
+            stargazers_count=get('stargazers_count', 0),
+            forks_count=get('forks_count', 0),
+            watchers_count=get('watchers_count', 0),
+            topics=get('topics', []),
+            created_at=get('created_at'),
+            updated_at=get('updated_at'),
+            pushed_at=get('pushed_at'),
+            size=get('size', 0),
+            archived=get('archived', False),
+            private=get('private', False),
+            fork=get('fork', False),
+            license=_intern_license(get('license')),
+            default_branch=intern(get('default_branch') or 'main'),
+            open_issues_count=get('open_issues_count', 0),
+            has_issues=get('has_issues', False),
+            has_projects=get('has_projects', False),
+            has_wiki=get('has_wiki', False),
+            has_pages=get('has_pages', False),
+            homepage=get('homepage'),
+            ssh_url=get('ssh_url'),
+            clone_url=get('clone_url'),
+            local_exists=get('local_exists', False),
+            need_update=get('need_update', True)
         )
+
+
+def _intern_license(license: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if license and isinstance(license.get('name'), str):
+        return dict(license, name=intern(license['name']))
+    return license
+
+
+@lru_cache(maxsize=4096)
+def _format_date(value: str) -> str:
+    try:
+        return Helpers.parse_github_date(value).strftime("%Y-%m-%d")
+    except Exception:
+        logger.debug("Failed to parse date %r", value, exc_info=True)
+        return "Invalid date"
+
+
+_FIELD_NAMES, _get_fields = fields_getter(Repository)
@@ -4,6 +4,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS
+
 
 class SSHKeyType(Enum):
     RSA = "rsa"
@@ -19,7 +21,7 @@ class SSHStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SSHKey:
     type: SSHKeyType
     private_path: Path
@@ -46,7 +48,7 @@ class SSHKey:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SSHConfig:
     ssh_dir: Path
     config_file: Path
@@ -71,7 +73,7 @@ class SSHConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class SSHValidationResult:
     status: SSHStatus
     ssh_config: SSHConfig
@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class GitHubToken:
     token: str
     username: str
@@ -14,10 +16,6 @@ class GitHubToken:
     rate_remaining: int = 5000
     rate_reset: Optional[str] = None
 
-    def __post_init__(self):
-        if not self.created_at:
-            self.created_at = datetime.now().isoformat()
-
     def __str__(self) -> str:
         return f"GitHubToken(username={self.username}, scopes={self.scopes})"
 
@@ -36,9 +34,10 @@ class GitHubToken:
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'GitHubToken':
+        get = data.get
         return cls(
-            token=data.get("token", ""),
-            username=data.get("username", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            scopes=data.get("scopes")
+            token=get("token", ""),
+            username=get("username", ""),
+            created_at=get("created_at") or datetime.now().isoformat(),
+            scopes=get("scopes")
         )
@@ -1,10 +1,15 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS, fields_getter
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class User:
     username: str
     name: Optional[str] = None
@@ -28,8 +33,8 @@ class User:
         try:
             dt = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
             return dt.strftime("%Y-%m-%d")
-        except Exception as e:
-            print(e)
+        except Exception:
+            logger.debug("Failed to parse date %r", self.created_at, exc_info=True)
             return "Invalid date"
 
     def update_from_api(self, api_data: Dict[str, Any]) -> None:
@@ -43,32 +48,25 @@ class User:
         self.created_at = api_data.get("created_at")
 
     def to_dict(self) -> Dict:
-        return {
-            "username": self.username,
-            "name": self.name,
-            "avatar_url": self.avatar_url,
-            "html_url": self.html_url,
-            "bio": self.bio,
-            "public_repos": self.public_repos,
-            "followers": self.followers,
-            "following": self.following,
-            "created_at": self.created_at,
-            "scopes": self.scopes
-        }
+        return dict(zip(_FIELD_NAMES, _get_fields(self)))
 
     @classmethod
     def from_dict(cls, data: Dict, token: str = None) -> 'User':
+        get = data.get
         user = cls(
-            username=data.get("username", ""),
-            name=data.get("name"),
-            avatar_url=data.get("avatar_url"),
-            html_url=data.get("html_url"),
-            bio=data.get("bio"),
-            public_repos=data.get("public_repos", 0),
-            followers=data.get("followers", 0),
-            following=data.get("following", 0),
-            created_at=data.get("created_at"),
-            scopes=data.get("scopes", []),
+            username=get("username", ""),
+            name=get("name"),
+            avatar_url=get("avatar_url"),
+            html_url=get("html_url"),
+            bio=get("bio"),
+            public_repos=get("public_repos", 0),
+            followers=get("followers", 0),
+            following=get("following", 0),
+            created_at=get("created_at"),
+            scopes=get("scopes", []),
             token=token
         )
         return user
+
+
+_FIELD_NAMES, _get_fields = fields_getter(User, exclude=('token',))
@@ -0,0 +1,114 @@
+# Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from smart_repository_manager_core.core.models.base import DATACLASS_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class RepoIndexEntry:
+    head_hash: str
+    commit_timestamp: int
+    branch: Optional[str] = None
+
+
+class RepoIndex:
+    MIN_REPOSITORIES = 16
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int, int], RepoIndexEntry]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, repo_path: Path) -> Optional[RepoIndexEntry]:
+        key = str(repo_path)
+        stamp = self._stamp(repo_path)
+        if stamp is None:
+            self.invalidate(repo_path)
+            return None
+
+        with self._lock:
+            cached = self._entries.get(key)
+
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        entry = self._load(repo_path)
+        with self._lock:
+            if entry is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (stamp, entry)
+
+        return entry
+
+    def invalidate(self, repo_path: Path) -> None:
+        with self._lock:
+            self._entries.pop(str(repo_path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _stamp(repo_path: Path) -> Optional[Tuple[int, int, int]]:
+        git_dir = repo_path / '.git'
+        try:
+            head_path = git_dir / 'HEAD'
+            head_mtime = os.stat(head_path).st_mtime_ns
+            head = head_path.read_text(encoding='ascii').strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        ref_mtime = 0
+        if head.startswith('ref: '):
+            try:
+                ref_mtime = os.stat(git_dir / head[len('ref: '):]).st_mtime_ns
+            except OSError:
+                pass
+
+        try:
+            packed_mtime = os.stat(git_dir / 'packed-refs').st_mtime_ns
+        except OSError:
+            packed_mtime = 0
+
+        return head_mtime, ref_mtime, packed_mtime
+
+    @staticmethod
+    def _load(repo_path: Path) -> Optional[RepoIndexEntry]:
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(repo_path), 'log', '-1', '--format=%H %ct %D'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=10
+            )
+
+            if result.returncode != 0:
+                return None
+
+            parts = result.stdout.decode('utf-8').strip().split(' ', 2)
+            if len(parts) < 2:
+                return None
+
+            branch = None
+            if len(parts) == 3 and parts[2].startswith('HEAD -> '):
+                branch = parts[2][len('HEAD -> '):].split(',')[0]
+
+            return RepoIndexEntry(
+                head_hash=parts[0],
+                commit_timestamp=int(parts[1]),
+                branch=branch
+            )
+        except Exception:
+            logger.debug("Failed to index repository %s", repo_path, exc_info=True)
+            return None
+
+
+repo_index = RepoIndex()
@@ -1,13 +1,79 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import io
 import os
+import queue
+import shutil
+import stat
+import subprocess
+import sys
+import threading
 import zipfile
 import tarfile
+import zlib
 from abc import ABC, abstractmethod
-from typing import ClassVar, Union, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import BinaryIO, ClassVar, Iterator, List, Union, Optional, Tuple
 from pathlib import Path
 
+try:
+    from isal import isal_zlib as deflate_zlib
+except ImportError:
+    deflate_zlib = zlib
+
+ONE_SHOT_DEFLATE = deflate_zlib is not zlib or sys.version_info >= (3, 11)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import grp
+    import pwd
+except ImportError:
+    grp = pwd = None
+
+
+class _QueueWriter(io.RawIOBase):
+
+    def __init__(self, chunks: queue.Queue):
+        super().__init__()
+        self._chunks = chunks
+        self._cancelled = threading.Event()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if not self._put(bytes(data)):
+            raise OSError("Archive stream was closed by the consumer")
+        return len(data)
+
+    def fail(self, error: Exception) -> None:
+        self._put(error)
+
+    def finish(self) -> None:
+        self._put(None)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def _put(self, item) -> bool:
+        while not self._cancelled.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
 
 class BaseArchiveCreator(ABC):
+    PARALLEL_SCAN_MIN_DIRS: ClassVar[int] = 16
+    STREAM_CHUNK_SIZE: ClassVar[int] = 1 << 20
+    STREAM_QUEUE_SIZE: ClassVar[int] = 8
 
     @classmethod
     @abstractmethod
@@ -30,6 +96,36 @@ class BaseArchiveCreator(ABC):
         cls._create_archive(folder_path_str, output_path)
         return output_path
 
+    @classmethod
+    def create_stream(cls, folder_path: Union[str, Path], **options) -> Iterator[bytes]:
+        folder_path_str = str(folder_path)
+        chunks = queue.Queue(maxsize=cls.STREAM_QUEUE_SIZE)
+        writer = _QueueWriter(chunks)
+
+        def produce() -> None:
+            try:
+                with io.BufferedWriter(writer, cls.STREAM_CHUNK_SIZE) as output:
+                    cls._create_archive(folder_path_str, output, **options)
+            except Exception as e:
+                writer.fail(e)
+            finally:
+                writer.finish()
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            writer.cancel()
+            producer.join()
+
     @classmethod
     def _get_output_path(cls, folder_path: str, output_dir: str, archive_name: Optional[str] = None) -> str:
         if archive_name:
@@ -43,29 +139,190 @@ class BaseArchiveCreator(ABC):
 
     @classmethod
     @abstractmethod
-    def _create_archive(cls, folder_path: str, output_path: str):
+    def _create_archive(cls, folder_path: str, output_path: Union[str, BinaryIO]):
         pass
 
     @classmethod
     def _add_files_to_archive(cls, folder_path: str, add_file_func):
         folder_path = str(folder_path)
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arc_name = os.path.relpath(file_path, folder_path)
-                add_file_func(file_path, arc_name)
+        prefix_length = len(os.path.join(folder_path, ''))
+        level = [folder_path]
+
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            while level:
+                if len(level) >= cls.PARALLEL_SCAN_MIN_DIRS:
+                    listings = executor.map(_scan_directory, level)
+                else:
+                    listings = map(_scan_directory, level)
+
+                next_level = []
+                for files, subdirs in listings:
+                    for file_path in files:
+                        add_file_func(file_path, file_path[prefix_length:])
+                    next_level.extend(subdirs)
+                level = next_level
 
 
 class ZipArchiveCreator(BaseArchiveCreator):
+    STORED_EXTENSIONS: ClassVar[frozenset] = frozenset({
+        '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.rar',
+        '.png', '.jpg', '.jpeg', '.gif', '.webp',
+        '.mp3', '.mp4', '.webm', '.mkv', '.avi', '.mov', '.flac', '.ogg',
+        '.jar', '.whl', '.pdf', '.pack'
+    })
+    GIT_OBJECTS_DIR: ClassVar[str] = os.path.join('', '.git', 'objects', '')
+    COPY_BUFFER_SIZE: ClassVar[int] = 1 << 20
+    PARALLEL_MAX_FILE_SIZE: ClassVar[int] = 8 << 20
+    RAW_WRITE_ATTRIBUTES: ClassVar[Tuple[str, ...]] = (
+        '_lock', '_writing', '_writecheck', '_didModify', 'fp', 'filelist', 'NameToInfo', 'start_dir'
+    )
 
     @classmethod
     def get_extension(cls) -> str:
         return "zip"
 
     @classmethod
-    def _create_archive(cls, folder_path: str, output_path: str):
+    def _create_archive(cls, folder_path: str, output_path: Union[str, BinaryIO]):
+        entries = []
+        cls._add_files_to_archive(folder_path, lambda file_path, arc_name: entries.append((file_path, arc_name)))
+
+        workers = min(8, os.cpu_count() or 1)
         with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            cls._add_files_to_archive(folder_path, zipf.write)
+            if workers < 2 or len(entries) < 2 or not cls._supports_raw_writes(zipf):
+                for file_path, arc_name in entries:
+                    cls._write_file(zipf, file_path, arc_name)
+                return
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                entries_iter = iter(entries)
+
+                def submit_next() -> None:
+                    entry = next(entries_iter, None)
+                    if entry is not None:
+                        pending.append(cls._submit_entry(executor, *entry))
+
+                for _ in range(workers * 2):
+                    submit_next()
+
+                while pending:
+                    file_path, arc_name, zinfo, future = pending.popleft()
+                    if future is None:
+                        cls._write_file(zipf, file_path, arc_name)
+                    else:
+                        cls._write_compressed(zipf, zinfo, *future.result())
+                    submit_next()
+
+    @classmethod
+    def _submit_entry(cls, executor: ThreadPoolExecutor, file_path: str, arc_name: str):
+        if not os.path.isfile(file_path):
+            return file_path, arc_name, None, None
+
+        zinfo = zipfile.ZipInfo.from_file(file_path, arc_name)
+        if zinfo.file_size > cls.PARALLEL_MAX_FILE_SIZE:
+            return file_path, arc_name, None, None
+
+        zinfo.compress_type = cls._get_compress_type(file_path)
+        return file_path, arc_name, zinfo, executor.submit(_compress_file, file_path, zinfo.compress_type)
+
+    @staticmethod
+    def _write_compressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo,
+                          compress_type: int, crc: int, file_size: int, payload: bytes):
+        zinfo.compress_type = compress_type
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(payload)
+
+        with zipf._lock:
+            if zipf._writing:
+                raise ValueError("Can't write to the ZIP file while there is another write handle open on it")
+
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+            zinfo.header_offset = zipf.fp.tell()
+            zipf.fp.write(zinfo.FileHeader())
+            zipf.fp.write(payload)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = zipf.fp.tell()
+
+    @classmethod
+    def _supports_raw_writes(cls, zipf: zipfile.ZipFile) -> bool:
+        return all(hasattr(zipf, name) for name in cls.RAW_WRITE_ATTRIBUTES)
+
+    @classmethod
+    def _write_file(cls, zipf: zipfile.ZipFile, file_path: str, arc_name: str):
+        if not os.path.isfile(file_path):
+            zipf.write(file_path, arc_name)
+            return
+
+        zinfo = zipfile.ZipInfo.from_file(file_path, arc_name)
+        zinfo.compress_type = cls._get_compress_type(file_path)
+
+        with open(file_path, 'rb', buffering=0) as src, zipf.open(zinfo, 'w') as dest:
+            shutil.copyfileobj(src, dest, cls.COPY_BUFFER_SIZE)
+
+    @classmethod
+    def _get_compress_type(cls, file_path: str) -> int:
+        if os.path.splitext(file_path)[1].lower() in cls.STORED_EXTENSIONS or cls.GIT_OBJECTS_DIR in file_path:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+
+@lru_cache(maxsize=None)
+def _user_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name if pwd else ''
+    except KeyError:
+        return ''
+
+
+@lru_cache(maxsize=None)
+def _group_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name if grp else ''
+    except KeyError:
+        return ''
+
+
+def _scan_directory(path: str) -> Tuple[List[str], List[str]]:
+    files = []
+    subdirs = []
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+    except OSError:
+        pass
+
+    return files, subdirs
+
+
+def _compress_file(file_path: str, compress_type: int) -> Tuple[int, int, int, bytes]:
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    if compress_type == zipfile.ZIP_DEFLATED:
+        payload = _deflate(data)
+        if len(payload) >= len(data):
+            compress_type, payload = zipfile.ZIP_STORED, data
+    else:
+        payload = data
+
+    return compress_type, deflate_zlib.crc32(data), len(data), payload
+
+
+def _deflate(data: bytes) -> bytes:
+    if ONE_SHOT_DEFLATE:
+        return deflate_zlib.compress(data, deflate_zlib.Z_DEFAULT_COMPRESSION, -15)
+
+    compressor = deflate_zlib.compressobj(deflate_zlib.Z_DEFAULT_COMPRESSION, deflate_zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
 
 
 class TarArchiveCreator(BaseArchiveCreator):
@@ -75,10 +332,17 @@ class TarArchiveCreator(BaseArchiveCreator):
         'bz2': 'w:bz2',
         'xz': 'w:xz'
     }
+    PARALLEL_COMPRESSORS: ClassVar[dict] = {
+        'gz': ['pigz', '-c'],
+        'bz2': ['pbzip2', '-c'],
+        'xz': ['xz', '-T0', '-c'],
+        'zst': ['zstd', '-T0', '-c']
+    }
+    ZSTD_LEVEL: ClassVar[int] = 3
 
     @classmethod
     def get_extension(cls, compression: str = '') -> str:
-        extensions = {'': 'tar', 'gz': 'tar.gz', 'bz2': 'tar.bz2', 'xz': 'tar.xz'}
+        extensions = {'': 'tar', 'gz': 'tar.gz', 'bz2': 'tar.bz2', 'xz': 'tar.xz', 'zst': 'tar.zst'}
         return extensions.get(compression, 'tar')
 
     @classmethod
@@ -86,7 +350,8 @@ class TarArchiveCreator(BaseArchiveCreator):
                folder_path: Union[str, Path],
                output_dir: Union[str, Path] = None,
                compression: str = '',
-               archive_name: Optional[str] = None) -> str:
+               archive_name: Optional[str] = None,
+               parallel_compression: bool = False) -> str:
         folder_path_str = str(folder_path) if isinstance(folder_path, Path) else folder_path
 
         if output_dir is None:
@@ -95,7 +360,10 @@ class TarArchiveCreator(BaseArchiveCreator):
             output_dir = str(output_dir) if isinstance(output_dir, Path) else output_dir
 
         output_path = cls._get_output_path_with_compression(folder_path_str, output_dir, compression, archive_name)
-        cls._create_archive(folder_path_str, output_path, compression)
+        if parallel_compression and cls._get_parallel_compressor(compression):
+            cls._create_archive_parallel(folder_path_str, output_path, compression)
+        else:
+            cls._create_archive(folder_path_str, output_path, compression)
         return output_path
 
     @classmethod
@@ -116,10 +384,81 @@ class TarArchiveCreator(BaseArchiveCreator):
         return os.path.join(output_dir, archive_name)
 
     @classmethod
-    def _create_archive(cls, folder_path: str, output_path: str, compression: str = ''):
+    def _create_archive(cls, folder_path: str, output_path: Union[str, BinaryIO], compression: str = ''):
+        if compression == 'zst':
+            cls._create_zstd_archive(folder_path, output_path)
+            return
+
         mode = cls.COMPRESSION_MODES.get(compression, 'w')
-        with tarfile.open(output_path, mode) as tarf:
-            cls._add_files_to_archive(folder_path, tarf.add)
+        if isinstance(output_path, str):
+            tarf = tarfile.open(output_path, mode)
+        else:
+            tarf = tarfile.open(fileobj=output_path, mode=f"w|{mode[2:]}")
+
+        with tarf:
+            cls._add_files_to_archive(folder_path, partial(cls._add_file, tarf))
+
+    @classmethod
+    def _create_zstd_archive(cls, folder_path: str, output_path: Union[str, BinaryIO]):
+        if zstandard is None:
+            if isinstance(output_path, str) and cls._get_parallel_compressor('zst'):
+                cls._create_archive_parallel(folder_path, output_path, 'zst')
+                return
+            raise ValueError("tar.zst archives require the zstandard package or the zstd command")
+
+        compressor = zstandard.ZstdCompressor(level=cls.ZSTD_LEVEL, threads=-1)
+        if isinstance(output_path, str):
+            with open(output_path, 'wb') as output:
+                cls._write_zstd_archive(folder_path, compressor, output)
+        else:
+            cls._write_zstd_archive(folder_path, compressor, output_path)
+
+    @classmethod
+    def _write_zstd_archive(cls, folder_path: str, compressor, output: BinaryIO):
+        with compressor.stream_writer(output, closefd=False) as stream, \
+                tarfile.open(fileobj=stream, mode='w|') as tarf:
+            cls._add_files_to_archive(folder_path, partial(cls._add_file, tarf))
+
+    @staticmethod
+    def _add_file(tarf: tarfile.TarFile, file_path: str, arc_name: str):
+        st = os.lstat(file_path)
+        if not stat.S_ISREG(st.st_mode) or st.st_nlink > 1 or os.path.abspath(file_path) == tarf.name:
+            tarf.add(file_path, arc_name)
+            return
+
+        tarinfo = tarfile.TarInfo(arc_name.replace(os.sep, '/'))
+        tarinfo.mode = stat.S_IMODE(st.st_mode)
+        tarinfo.uid = st.st_uid
+        tarinfo.gid = st.st_gid
+        tarinfo.size = st.st_size
+        tarinfo.mtime = st.st_mtime
+        tarinfo.uname = _user_name(st.st_uid)
+        tarinfo.gname = _group_name(st.st_gid)
+
+        with open(file_path, 'rb') as f:
+            tarf.addfile(tarinfo, f)
+
+    @classmethod
+    def _get_parallel_compressor(cls, compression: str) -> Optional[List[str]]:
+        command = cls.PARALLEL_COMPRESSORS.get(compression)
+        if command and shutil.which(command[0]):
+            return command
+        return None
+
+    @classmethod
+    def _create_archive_parallel(cls, folder_path: str, output_path: str, compression: str):
+        with open(output_path, 'wb') as output:
+            process = subprocess.Popen(cls._get_parallel_compressor(compression), stdin=subprocess.PIPE, stdout=output)
+
+            try:
+                with tarfile.open(fileobj=process.stdin, mode='w|') as tarf:
+                    cls._add_files_to_archive(folder_path, partial(cls._add_file, tarf))
+            finally:
+                process.stdin.close()
+                return_code = process.wait()
+
+        if return_code != 0:
+            raise RuntimeError(f"Compressor exited with code {return_code}")
 
 
 class ArchiveCreator:
@@ -129,7 +468,17 @@ class ArchiveCreator:
         'tar.gz': TarArchiveCreator,
         'tgz': TarArchiveCreator,
         'tar.bz2': TarArchiveCreator,
-        'tar.xz': TarArchiveCreator
+        'tar.xz': TarArchiveCreator,
+        'tar.zst': TarArchiveCreator
+    }
+    _DISPATCH: ClassVar[dict] = {
+        'zip': (ZipArchiveCreator, {}),
+        'tar': (TarArchiveCreator, {'compression': ''}),
+        'tar.gz': (TarArchiveCreator, {'compression': 'gz'}),
+        'tgz': (TarArchiveCreator, {'compression': 'gz'}),
+        'tar.bz2': (TarArchiveCreator, {'compression': 'bz2'}),
+        'tar.xz': (TarArchiveCreator, {'compression': 'xz'}),
+        'tar.zst': (TarArchiveCreator, {'compression': 'zst'})
     }
 
     @classmethod
@@ -139,14 +488,20 @@ class ArchiveCreator:
                        output_dir: Union[str, Path] = None,
                        archive_name: Optional[str] = None,
                        **kwargs) -> str:
-        creator_class = cls.FORMATS.get(archive_format)
-        if not creator_class:
-            raise ValueError(f"Unsupported archive format: {archive_format}")
-
-        if creator_class == TarArchiveCreator:
-            compression = 'gz' if archive_format in ['tar.gz',
-                                                     'tgz'] else 'bz2' if archive_format == 'tar.bz2' else 'xz' \
-                if archive_format == 'tar.xz' else ''
-            return creator_class.create(folder_path, output_dir, compression, archive_name, **kwargs)
-        else:
-            return creator_class.create(folder_path, output_dir, archive_name, **kwargs)
+        try:
+            creator_class, options = cls._DISPATCH[archive_format]
+        except KeyError:
+            raise ValueError(f"Unsupported archive format: {archive_format}") from None
+
+        return creator_class.create(folder_path, output_dir, archive_name=archive_name, **options, **kwargs)
+
+    @classmethod
+    def create_archive_stream(cls,
+                              folder_path: Union[str, Path],
+                              archive_format: str = 'zip') -> Iterator[bytes]:
+        try:
+            creator_class, options = cls._DISPATCH[archive_format]
+        except KeyError:
+            raise ValueError(f"Unsupported archive format: {archive_format}") from None
+
+        return creator_class.create_stream(folder_path, **options)
@@ -1,6 +1,7 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from smart_repository_manager_core.core.models.config import AppConfig
 from smart_repository_manager_core.utils.file_ops import FileOperations
@@ -15,6 +16,9 @@ class ConfigService:
             self.config_path = config_path
 
         self._config: Optional[AppConfig] = None
+        self._batch_depth = 0
+        self._dirty = False
+        self._saved_payload: Optional[bytes] = None
 
     def load_config(self) -> AppConfig:
         data, success = FileOperations.read_json(self.config_path)
@@ -34,6 +38,16 @@ class ConfigService:
 
         return self._save_config()
 
+    @contextmanager
+    def batch(self) -> Iterator['ConfigService']:
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_config()
+
     def get_config(self) -> AppConfig:
         if self._config is None:
             return self.load_config()
@@ -80,5 +94,16 @@ class ConfigService:
         if self._config is None:
             return False
 
-        config_dict = self._config.to_dict()
-        return FileOperations.write_json(self.config_path, config_dict)
+        if self._batch_depth:
+            self._dirty = True
+            return True
+
+        self._dirty = False
+        payload = FileOperations.dumps_json(self._config.to_dict())
+        if payload == self._saved_payload:
+            return True
+
+        success = FileOperations.write_bytes(self.config_path, payload, durable=True)
+        if success:
+            self._saved_payload = payload
+        return success
@@ -1,38 +1,55 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+import os
 import shutil
 import subprocess
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 
 from smart_repository_manager_core.core.git_commands import GitCommandResult, GitOperationStatus
 from smart_repository_manager_core.core.git_operations import GitCloneOperation, GitPullOperation, GitStatusOperation
+from smart_repository_manager_core.core.git_process_pool import GitProcessPool
 from smart_repository_manager_core.core.models.repository import Repository
 from smart_repository_manager_core.utils.validators import Validators
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+logger = logging.getLogger(__name__)
+
+GIT_ERRORS = (subprocess.SubprocessError, OSError, ValueError) + ((pygit2.GitError,) if pygit2 is not None else ())
+
+
 class GitService:
 
     def __init__(self, token: Optional[str] = None, timeout: int = 30):
         self.token = token
         self.timeout = timeout
 
-    def clone_repository(self, clone_url: str, target_path: Path, token: Optional[str] = None) -> GitCommandResult:
+    def clone_repository(self, clone_url: str, target_path: Path, token: Optional[str] = None,
+                         shallow: bool = False, partial: bool = False) -> GitCommandResult:
         if not Validators.validate_path(target_path)[0]:
             return GitCommandResult(
                 success=False,
                 error="Invalid target path"
             )
 
-        operation = GitCloneOperation(timeout=self.timeout)
+        operation = GitCloneOperation(timeout=self.timeout, shallow=shallow, partial=partial)
         return operation.execute(clone_url, target_path, token or self.token)
 
-    def pull_repository(self, repo_path: Path, token: Optional[str] = None) -> GitCommandResult:
+    def pull_repository(self, repo_path: Path, token: Optional[str] = None,
+                        unshallow: bool = False) -> GitCommandResult:
         if not repo_path.exists() or not (repo_path / '.git').exists():
             return GitCommandResult(
                 success=False,
                 error="Not a git repository"
             )
 
-        operation = GitPullOperation(timeout=self.timeout)
+        operation = GitPullOperation(timeout=self.timeout, unshallow=unshallow)
         return operation.execute(repo_path, token or self.token)
 
     def check_repository_status(self, repo: Repository, repo_path: Path) -> GitOperationStatus:
@@ -54,68 +71,122 @@ class GitService:
             status.success = True
             return status
 
-        except Exception as e:
-            print(e)
+        except GIT_ERRORS as e:
+            logger.debug("Status check failed for %s: %s", repo_path, e)
             status.message = "Status check failed"
             status.success = False
             return status
 
+    def check_repositories_status(self, items: List[Tuple[Repository, Path]]) -> List[GitOperationStatus]:
+        if not items:
+            return []
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+        with GitProcessPool(max_workers) as pool:
+            return pool.map(self.check_repository_status, items)
+
     def get_repository_info(self, repo_path: Path) -> Optional[Dict]:
         if not repo_path.exists() or not (repo_path / '.git').exists():
             return None
 
         try:
-            info = {}
-
-            branch_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-parse', '--abbrev-ref', 'HEAD'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
-            )
-
-            if branch_result.returncode == 0:
-                info['branch'] = branch_result.stdout.strip()
-
-            date_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'log', '-1', '--format=%cI'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
-            )
-
-            if date_result.returncode == 0 and date_result.stdout.strip():
-                info['last_commit'] = date_result.stdout.strip()
+            signature = self._get_info_signature(repo_path)
+            if signature is None:
+                return self._load_repository_info(repo_path)
+            return dict(_cached_repository_info(signature))
 
-            count_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-list', '--count', 'HEAD'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
-            )
+        except GIT_ERRORS as e:
+            logger.debug("Failed to read repository info for %s: %s", repo_path, e)
+            return None
 
-            if count_result.returncode == 0:
-                info['commit_count'] = int(count_result.stdout.strip())
+    @staticmethod
+    def _get_info_signature(repo_path: Path) -> Optional[Tuple]:
+        git_dir = repo_path / '.git'
+        if not git_dir.is_dir():
+            return None
 
-            remote_result = subprocess.run(
-                ['git', '-C', str(repo_path), 'remote', 'get-url', 'origin'],
+        head = (git_dir / 'HEAD').read_bytes().strip()
+        watched = ['packed-refs', 'config']
+        if head.startswith(b'ref: '):
+            watched.append(head[5:].decode('utf-8'))
+
+        mtimes = []
+        for name in watched:
+            try:
+                mtimes.append(os.stat(git_dir / name).st_mtime_ns)
+            except FileNotFoundError:
+                mtimes.append(0)
+
+        return (str(repo_path), head, *mtimes)
+
+    @staticmethod
+    def _load_repository_info(repo_path: Path) -> Dict:
+        if pygit2 is not None:
+            return GitService._read_repository_info(repo_path)
+        return GitService._query_repository_info(repo_path)
+
+    @staticmethod
+    def _read_repository_info(repo_path: Path) -> Dict:
+        info = {}
+        repo = pygit2.Repository(str(repo_path))
+
+        if not repo.head_is_unborn:
+            info['branch'] = 'HEAD' if repo.head_is_detached else repo.head.shorthand
+
+            commit = repo.head.peel(pygit2.Commit)
+            commit_tz = timezone(timedelta(minutes=commit.commit_time_offset))
+            info['last_commit'] = datetime.fromtimestamp(commit.commit_time, commit_tz).isoformat()
+            info['commit_count'] = sum(1 for _ in repo.walk(commit.id))
+
+        if 'origin' in repo.remotes.names():
+            info['remote_url'] = repo.remotes['origin'].url
+
+        return info
+
+    @staticmethod
+    def _query_repository_info(repo_path: Path) -> Dict:
+        info = {}
+        commands = {
+            'head': ['log', '-1', '--no-show-signature', '--format=%cI%n%D', 'HEAD'],
+            'count': ['rev-list', '--count', 'HEAD'],
+            'remote': ['remote', 'get-url', 'origin'],
+        }
+
+        processes = {
+            key: subprocess.Popen(
+                ['git', '-C', str(repo_path), *args],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
+                stderr=subprocess.DEVNULL
             )
+            for key, args in commands.items()
+        }
 
-            if remote_result.returncode == 0:
-                info['remote_url'] = remote_result.stdout.strip()
-
-            return info
-
-        except Exception as e:
-            print(e)
-            return None
+        try:
+            outputs = {}
+            for key, process in processes.items():
+                stdout, _ = process.communicate(timeout=5)
+                if process.returncode == 0:
+                    outputs[key] = stdout.decode('utf-8').strip()
+        finally:
+            for process in processes.values():
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+        if 'head' in outputs:
+            last_commit, _, decoration = outputs['head'].partition('\n')
+            head_ref = decoration.split(', ')[0]
+            info['branch'] = head_ref[len('HEAD -> '):] if head_ref.startswith('HEAD -> ') else 'HEAD'
+            if last_commit:
+                info['last_commit'] = last_commit
+
+        if 'count' in outputs:
+            info['commit_count'] = int(outputs['count'])
+
+        if 'remote' in outputs:
+            info['remote_url'] = outputs['remote']
+
+        return info
 
     def cleanup_repository(self, repo_path: Path) -> bool:
         try:
@@ -123,11 +194,16 @@ class GitService:
                 shutil.rmtree(repo_path, ignore_errors=True)
                 return True
             return True
-        except Exception as e:
-            print(e)
+        except OSError as e:
+            logger.debug("Failed to remove %s: %s", repo_path, e)
             return False
 
     def verify_repository(self, repo_path: Path) -> bool:
         operation = GitStatusOperation()
         needs_update, _ = operation.check_needs_update(repo_path)
         return not needs_update
+
+
+@lru_cache(maxsize=1024)
+def _cached_repository_info(signature: Tuple) -> Dict:
+    return GitService._load_repository_info(Path(signature[0]))
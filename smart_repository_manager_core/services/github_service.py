@@ -1,17 +1,38 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
+import re
 import requests
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from smart_repository_manager_core import __version__
 from smart_repository_manager_core.core.models.repository import Repository
 from smart_repository_manager_core.core.models.token import GitHubToken
 from smart_repository_manager_core.core.models.user import User
-from smart_repository_manager_core.utils.helpers import Helpers
 from smart_repository_manager_core.utils.validators import Validators
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+API_ERRORS = (requests.RequestException, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
+ACCEPT_HEADER = "application/vnd.github.v3+json"
+USER_AGENT = f"smart-repository-manager-core/{__version__}"
+LAST_PAGE_PATTERN = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
 
 class GitHubService:
     BASE_URL = "https://api.github.com"
+    PER_PAGE = 100
+    MAX_PAGES = 10
+    MAX_WORKERS = 8
 
     def __init__(self, token: str):
         if not Validators.validate_token(token):
@@ -19,15 +40,32 @@ class GitHubService:
 
         self.token = token
         self.headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json"
+            "Authorization": "token " + token,
+            "Accept": ACCEPT_HEADER,
+            "User-Agent": USER_AGENT
         }
 
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=False,
+                raise_on_status=False
+            )
+        ))
+
+    def close(self) -> None:
+        self.session.close()
+
     def validate_token(self) -> Tuple[bool, Optional[User]]:
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/user",
-                headers=self.headers,
                 timeout=10
             )
 
@@ -46,54 +84,58 @@ class GitHubService:
 
             return False, None
 
-        except Exception as e:
-            print(e)
+        except API_ERRORS as e:
+            logger.debug("Token validation failed: %s", e)
             return False, None
 
     def fetch_user_repositories(self) -> Tuple[bool, List[Repository]]:
-        all_repos = []
-        page = 1
-        per_page = 100
+        repositories = []
+        seen_ids = set()
 
         try:
-            while True:
-                url = f"{self.BASE_URL}/user/repos"
-                params = {
-                    "page": page,
-                    "per_page": per_page,
-                    "sort": "updated",
-                    "affiliation": "owner",
-                    "visibility": "all",
-                }
-
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=30
-                )
-
-                if response.status_code != 200:
-                    break
+            response = self._fetch_repositories_page(1)
+            if response.status_code == 200:
+                last_page = min(self._get_last_page(response.headers.get('Link', '')), self.MAX_PAGES)
+                if self._collect_repositories(response, seen_ids, repositories) and last_page > 1:
+                    self._collect_remaining_pages(last_page, seen_ids, repositories)
+            else:
+                response.close()
 
-                repos = response.json()
-                if not repos:
-                    break
+            return True, repositories
 
-                all_repos.extend(repos)
+        except API_ERRORS as e:
+            logger.debug("Failed to fetch repositories: %s", e)
+            return False, []
 
-                link_header = response.headers.get('Link', '')
-                if 'rel="next"' not in link_header:
-                    break
+    def _collect_remaining_pages(self, last_page: int, seen_ids: set, repositories: List[Repository]) -> None:
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, last_page - 1)) as executor:
+            futures = [executor.submit(self._fetch_repositories_page, page) for page in range(2, last_page + 1)]
+
+            try:
+                for future in futures:
+                    response = future.result()
+                    if response.status_code != 200:
+                        break
+                    if not self._collect_repositories(response, seen_ids, repositories):
+                        break
+            finally:
+                for future in futures:
+                    if not future.cancel():
+                        future.add_done_callback(_close_response)
+
+    def _collect_repositories(self, response: requests.Response, seen_ids: set,
+                              repositories: List[Repository]) -> int:
+        count = 0
 
-                page += 1
-                if page > 10:
-                    break
+        try:
+            for repo_data in self._iter_page(response):
+                count += 1
 
-            unique_repos = Helpers.deduplicate_list(all_repos, 'id')
-            repositories = []
+                repo_id = repo_data.get('id')
+                if not repo_id or repo_id in seen_ids:
+                    continue
+                seen_ids.add(repo_id)
 
-            for repo_data in unique_repos:
                 try:
                     repo = Repository.from_dict(repo_data)
 
@@ -101,21 +143,49 @@ class GitHubService:
                         repo.clone_url = repo_data.get('clone_url')
 
                     repositories.append(repo)
-                except Exception as e:
-                    print(e)
+                except (TypeError, ValueError, AttributeError) as e:
+                    logger.debug("Skipping malformed repository %r: %s", repo_id, e)
                     continue
+        finally:
+            response.close()
+
+        return count
+
+    @staticmethod
+    def _iter_page(response: requests.Response) -> Iterator[Dict]:
+        if ijson is None:
+            return iter(response.json())
+
+        response.raw.decode_content = True
+        return ijson.items(response.raw, 'item')
+
+    def _fetch_repositories_page(self, page: int) -> requests.Response:
+        params = {
+            "page": page,
+            "per_page": self.PER_PAGE,
+            "sort": "updated",
+            "affiliation": "owner",
+            "visibility": "all",
+        }
 
-            return True, repositories
+        return self.session.get(
+            f"{self.BASE_URL}/user/repos",
+            params=params,
+            timeout=30,
+            stream=ijson is not None
+        )
 
-        except Exception as e:
-            print(e)
-            return False, []
+    @staticmethod
+    def _get_last_page(link_header: str) -> int:
+        match = LAST_PAGE_PATTERN.search(link_header)
+        if match:
+            return int(match.group(1))
+        return 1
 
     def get_token_info(self) -> GitHubToken:
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/user",
-                headers=self.headers,
                 timeout=10
             )
 
@@ -132,8 +202,8 @@ class GitHubService:
             token.update_rate_limits(response.headers)
             return token
 
-        except Exception as e:
-            print(e)
+        except API_ERRORS as e:
+            logger.debug("Failed to fetch token info: %s", e)
             return GitHubToken(
                 token=self.token,
                 username="",
@@ -142,9 +212,8 @@ class GitHubService:
 
     def check_rate_limits(self) -> Dict[str, int]:
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}/rate_limit",
-                headers=self.headers,
                 timeout=5
             )
 
@@ -161,6 +230,11 @@ class GitHubService:
 
             return {"limit": 60, "remaining": 60, "reset": 0}
 
-        except Exception as e:
-            print(e)
+        except API_ERRORS as e:
+            logger.debug("Failed to fetch rate limits: %s", e)
             return {"limit": 60, "remaining": 60, "reset": 0}
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
@@ -1,11 +1,26 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import asyncio
 import ipaddress
+import platform
 import socket
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Tuple, List, Optional
 from urllib.parse import urlparse
 from datetime import datetime
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+USER_AGENT = "SmartGitCore/1.0.0"
+HEAD_UNSUPPORTED = (405, 501)
+PING_COUNT_FLAG = "-n" if platform.system().lower() == "windows" else "-c"
+
 
 class NetworkCheckResult:
 
@@ -31,6 +46,9 @@ class NetworkCheckResult:
 
 
 class NetworkService:
+    DNS_CACHE_TTL = 300
+    DNS_NEGATIVE_TTL = 60
+    EXTERNAL_IP_TTL = 900
 
     DEFAULT_CHECK_SERVERS = [
         {
@@ -65,24 +83,79 @@ class NetworkService:
             "https://ifconfig.me/ip",
         ]
 
-    def check_network(self) -> NetworkCheckResult:
-        import time
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._dns_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._dns_lock = threading.Lock()
+        self._local_ip: Optional[str] = None
+        self._hostname: Optional[str] = None
+        self._external_ip_cache: Optional[Tuple[float, str]] = None
 
+    def close(self) -> None:
+        self.session.close()
+
+    def check_network(self, stop_on_success: bool = False) -> NetworkCheckResult:
         result = NetworkCheckResult()
         result.timestamp = datetime.now().isoformat()
-        start_time = time.time()
+        start_time = time.monotonic()
+
+        servers = self.check_servers
+        order = sorted(range(len(servers)), key=lambda index: not self._is_ip_endpoint(servers[index]["url"]))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, len(servers)))
+        futures = {executor.submit(self._check_single_server, servers[index]): index for index in order}
+        checks = {}
+
+        try:
+            for future in as_completed(futures):
+                check_result = future.result()
+                checks[futures[future]] = check_result
+                if stop_on_success and check_result["success"]:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=not stop_on_success)
+
+        result.detailed_results.extend(checks[index] for index in sorted(checks))
+        return self._finish_check(result, start_time)
+
+    @staticmethod
+    def _is_ip_endpoint(url: str) -> bool:
+        try:
+            ipaddress.ip_address(urlparse(url).hostname or "")
+            return True
+        except ValueError:
+            return False
+
+    async def check_network_async(self) -> NetworkCheckResult:
+        if aiohttp is None:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.check_network)
 
-        successful_checks = 0
+        result = NetworkCheckResult()
+        result.timestamp = datetime.now().isoformat()
+        start_time = time.monotonic()
 
-        for server in self.check_servers:
-            check_result = self._check_single_server(server)
-            result.detailed_results.append(check_result)
+        async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=self.DNS_CACHE_TTL),
+                headers={"User-Agent": USER_AGENT}
+        ) as session:
+            result.detailed_results.extend(await asyncio.gather(
+                *[self._check_single_server_async(session, server) for server in self.check_servers]
+            ))
 
-            if check_result["success"]:
-                successful_checks += 1
+        return self._finish_check(result, start_time)
 
-        result.is_online = successful_checks > 0
-        result.check_duration = time.time() - start_time
+    @staticmethod
+    def _finish_check(result: NetworkCheckResult, start_time: float) -> NetworkCheckResult:
+        result.is_online = any(check["success"] for check in result.detailed_results)
+        result.check_duration = time.monotonic() - start_time
 
         if not result.is_online:
             result.recommendations = [
@@ -97,9 +170,11 @@ class NetworkService:
         return result
 
     def is_online(self) -> bool:
+        if self._check_with_socket():
+            return True
+
         try:
-            response = requests.get("https://8.8.8.8", timeout=self.timeout)
-            return response.status_code < 500
+            return self._probe("https://8.8.8.8") < 500
         except Exception as e:
             print(e)
             return self._fallback_check()
@@ -111,11 +186,9 @@ class NetworkService:
             ("Bitbucket", "https://bitbucket.org")
         ]
 
-        results = []
-        for name, url in git_servers:
-            success, message = self._check_server(url, name)
-            results.append((name, success, message))
+        results = self._first_success(self._check_git_server, git_servers, lambda result: result[1])
 
+        for name, success, message in results:
             if success:
                 return True, f"Connection to {name} is working"
 
@@ -124,17 +197,7 @@ class NetworkService:
 
     def check_dns_resolution(self, hostname: str = "github.com") -> Tuple[bool, str, List[str]]:
         try:
-            import socket
-
-            ip_addresses = []
-            try:
-                addr_info = socket.getaddrinfo(hostname, None)
-                for info in addr_info:
-                    ip = info[4][0]
-                    if ip not in ip_addresses:
-                        ip_addresses.append(ip)
-            except socket.gaierror:
-                pass
+            ip_addresses = self._resolve(hostname)
 
             if ip_addresses:
                 return True, f"DNS resolution works for {hostname}", ip_addresses
@@ -144,14 +207,35 @@ class NetworkService:
         except Exception as e:
             return False, f"DNS check error: {str(e)}", []
 
+    def _resolve(self, hostname: str) -> List[str]:
+        now = time.monotonic()
+        with self._dns_lock:
+            cached = self._dns_cache.get(hostname)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+
+        ip_addresses = []
+        try:
+            for info in socket.getaddrinfo(hostname, None):
+                ip = info[4][0]
+                if ip not in ip_addresses:
+                    ip_addresses.append(ip)
+            ttl = self.DNS_CACHE_TTL
+        except socket.gaierror:
+            ttl = self.DNS_NEGATIVE_TTL
+
+        with self._dns_lock:
+            self._dns_cache[hostname] = (now + ttl, ip_addresses)
+
+        return list(ip_addresses)
+
     def get_network_info(self) -> Dict[str, Any]:
         try:
-            import socket
             import psutil
 
             network_info = {
-                "hostname": socket.gethostname(),
-                "ip_address": socket.gethostbyname(socket.gethostname()),
+                "hostname": self._get_hostname(),
+                "ip_address": self._get_local_ip(),
                 "interfaces": []
             }
 
@@ -174,101 +258,109 @@ class NetworkService:
             return network_info
 
         except ImportError:
-            import socket
             return {
-                "hostname": socket.gethostname(),
-                "ip_address": socket.gethostbyname(socket.gethostname()),
+                "hostname": self._get_hostname(),
+                "ip_address": self._get_local_ip(),
                 "note": "Install psutil for detailed network information"
             }
         except Exception as e:
             return {"error": str(e)}
 
     def _check_single_server(self, server: Dict[str, str]) -> Dict[str, Any]:
-        start_time = datetime.now()
+        timestamp = datetime.now().isoformat()
+        start_time = time.monotonic()
 
         try:
-            response = requests.get(
-                server["url"],
-                timeout=self.timeout,
-                headers={"User-Agent": "SmartGitCore/1.0.0"}
-            )
+            status_code = self._probe(server["url"])
+            return self._server_result(server, timestamp, time.monotonic() - start_time, status_code)
 
-            duration = (datetime.now() - start_time).total_seconds()
+        except requests.exceptions.Timeout:
+            return self._server_result(server, timestamp, time.monotonic() - start_time, error="Timeout")
 
-            return {
-                "name": server["name"],
-                "url": server["url"],
-                "description": server.get("description", ""),
-                "success": response.status_code < 500,
-                "status_code": response.status_code,
-                "response_time": duration,
-                "timestamp": start_time.isoformat(),
-                "error": None
-            }
+        except Exception as e:
+            return self._server_result(server, timestamp, time.monotonic() - start_time, error=str(e))
 
-        except requests.exceptions.Timeout:
-            duration = (datetime.now() - start_time).total_seconds()
-            return {
-                "name": server["name"],
-                "url": server["url"],
-                "description": server.get("description", ""),
-                "success": False,
-                "status_code": None,
-                "response_time": duration,
-                "timestamp": start_time.isoformat(),
-                "error": "Timeout"
-            }
+    async def _check_single_server_async(self, session, server: Dict[str, str]) -> Dict[str, Any]:
+        timestamp = datetime.now().isoformat()
+        start_time = time.monotonic()
+
+        try:
+            async with session.head(server["url"], allow_redirects=False) as response:
+                status_code = response.status
+
+            if status_code in HEAD_UNSUPPORTED:
+                async with session.get(server["url"]) as response:
+                    status_code = response.status
+
+            return self._server_result(server, timestamp, time.monotonic() - start_time, status_code)
+
+        except asyncio.TimeoutError:
+            return self._server_result(server, timestamp, time.monotonic() - start_time, error="Timeout")
 
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
-            return {
-                "name": server["name"],
-                "url": server["url"],
-                "description": server.get("description", ""),
-                "success": False,
-                "status_code": None,
-                "response_time": duration,
-                "timestamp": start_time.isoformat(),
-                "error": str(e)
-            }
+            return self._server_result(server, timestamp, time.monotonic() - start_time, error=str(e))
+
+    @staticmethod
+    def _server_result(server: Dict[str, str], timestamp: str, duration: float,
+                       status_code: Optional[int] = None, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "name": server["name"],
+            "url": server["url"],
+            "description": server.get("description", ""),
+            "success": status_code is not None and status_code < 500,
+            "status_code": status_code,
+            "response_time": duration,
+            "timestamp": timestamp,
+            "error": error
+        }
+
+    def _probe(self, url: str) -> int:
+        response = self.session.head(url, allow_redirects=False, timeout=self.timeout)
+        if response.status_code not in HEAD_UNSUPPORTED:
+            return response.status_code
+
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            return response.status_code
 
     def _fallback_check(self) -> bool:
         fallback_methods = [
-            self._check_with_socket,
             self._check_with_ping,
             self._check_dns_resolution_fallback
         ]
 
-        for method in fallback_methods:
-            try:
-                if method():
-                    return True
-            except Exception as e:
-                print(e)
-                continue
+        try:
+            results = self._first_success(self._run_fallback, fallback_methods, bool, timeout=self.timeout)
+        except FuturesTimeoutError:
+            return False
 
-        return False
+        return any(results)
+
+    @staticmethod
+    def _run_fallback(method) -> bool:
+        try:
+            return bool(method())
+        except Exception as e:
+            print(e)
+            return False
 
     def _check_with_socket(self) -> bool:
         try:
-            socket.create_connection(("8.8.8.8", 53), timeout=self.timeout)
-            return True
+            with socket.create_connection(("8.8.8.8", 53), timeout=self.timeout):
+                return True
         except Exception as e:
             print(e)
             return False
 
     def _check_with_ping(self) -> bool:
-        import platform
         import subprocess
 
-        param = "-n" if platform.system().lower() == "windows" else "-c"
-        command = ["ping", param, "1", "8.8.8.8"]
+        command = ["ping", PING_COUNT_FLAG, "1", "8.8.8.8"]
 
         try:
             result = subprocess.run(
                 command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=self.timeout
             )
             return result.returncode == 0
@@ -293,55 +385,117 @@ class NetworkService:
             if not dns_ok:
                 return False, f"DNS error: {dns_msg}"
 
-            response = requests.get(url, timeout=self.timeout)
-            if response.status_code < 500:
+            status_code = self._probe(url)
+            if status_code < 500:
                 return True, f"Connected successfully"
             else:
-                return False, f"HTTP {response.status_code}"
+                return False, f"HTTP {status_code}"
 
         except requests.exceptions.Timeout:
             return False, "Timeout"
         except Exception as e:
             return False, str(e)
 
+    def _check_git_server(self, server: Tuple[str, str]) -> Tuple[str, bool, str]:
+        name, url = server
+        success, message = self._check_server(url, name)
+        return name, success, message
+
     def get_external_ip(self) -> Optional[str]:
+        cached = self._external_ip_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        results = self._first_success(
+            self._fetch_ip,
+            self.ip_services,
+            lambda ip: bool(ip) and self.is_valid_ip(ip)
+        )
+        for ip in results:
+            if ip and self.is_valid_ip(ip):
+                self._external_ip_cache = (time.monotonic() + self.EXTERNAL_IP_TTL, ip)
+                return ip
+
+        ip_address = self._get_local_ip()
+        if ip_address and self.is_valid_ip(ip_address):
+            return f"{ip_address} (local)"
+
+        return None
 
-        for service in self.ip_services:
-            try:
-                response = requests.get(service, timeout=3)
-                if response.status_code == 200:
-                    ip = response.text.strip()
-                    if self.is_valid_ip(ip):
-                        return ip
-            except Exception as e:
-                print(e)
-                continue
+    def _get_hostname(self) -> str:
+        if self._hostname is None:
+            self._hostname = socket.gethostname()
+        return self._hostname
 
+    def _get_local_ip(self) -> Optional[str]:
+        if self._local_ip is None:
+            self._local_ip = self._find_local_ip()
+        return self._local_ip
+
+    @staticmethod
+    def _find_local_ip() -> Optional[str]:
         try:
-            hostname = socket.gethostname()
-            ip_address = socket.gethostbyname(hostname)
-            if self.is_valid_ip(ip_address):
-                return f"{ip_address} (local)"
+            import psutil
+
+            for addrs in psutil.net_if_addrs().values():
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and not ipaddress.ip_address(addr.address).is_loopback:
+                        return addr.address
+        except ImportError:
+            pass
         except Exception as e:
             print(e)
+
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect(("8.8.8.8", 53))
+                return sock.getsockname()[0]
+        except OSError:
             pass
 
-        return None
+        try:
+            return socket.gethostbyname(socket.gethostname())
+        except Exception as e:
+            print(e)
+            return None
 
     def get_ip(self):
+        results = self._first_success(self._fetch_ip, self.ip_services, bool)
+        for ip in results:
+            if ip:
+                return ip
 
-        for service in self.ip_services:
-            try:
-                response = requests.get(service, timeout=3)
-                if response.status_code == 200:
-                    ip = response.text.strip()
-                    return ip
-            except Exception as e:
-                print(e)
-                continue
+        return None
 
+    def _fetch_ip(self, service: str) -> Optional[str]:
+        try:
+            response = self.session.get(service, timeout=3)
+            if response.status_code == 200:
+                return response.text.strip()
+        except Exception as e:
+            print(e)
         return None
 
+    @staticmethod
+    def _first_success(func, items: List, accept, timeout: Optional[float] = None) -> List:
+        if not items:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=len(items))
+        futures = [executor.submit(func, item) for item in items]
+
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                result = future.result()
+                if accept(result):
+                    return [result]
+
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     @staticmethod
     def is_valid_ip(ip: str) -> bool:
         try:
@@ -1,12 +1,28 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
-import json
+import logging
+import os
+import re
 import shutil
+import stat
+import threading
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+from smart_repository_manager_core.utils.file_ops import WRITE_FLAGS, FileOperations
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+logger = logging.getLogger(__name__)
+
 
 class StorageService:
+    SIMDJSON_MIN_SIZE = 64 * 1024
 
     def __init__(self, base_path: Optional[Path] = None):
         if base_path is None:
@@ -14,6 +30,10 @@ class StorageService:
         else:
             self.base_path = base_path
 
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+        self._json_parser_lock = threading.Lock()
+        self._parents_created: Set[Path] = set()
+
         self._ensure_base_path()
 
     def _ensure_base_path(self) -> bool:
@@ -21,20 +41,28 @@ class StorageService:
             self.base_path.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            print(e)
+            logger.warning("Failed to create storage directory %s: %s", self.base_path, e)
             return False
 
-    def save_json(self, filename: str, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    def save_json(self, filename: str, data: Dict[str, Any], pretty: bool = True,
+                  durable: bool = True, sync_dir: bool = True) -> Tuple[bool, Optional[str]]:
         try:
             file_path = self.base_path / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = file_path.parent / (file_path.name + '.tmp')
 
-            temp_path = file_path.with_suffix('.tmp')
+            def write() -> None:
+                fd = os.open(temp_path, WRITE_FLAGS, 0o644)
+                with os.fdopen(fd, 'wb') as f:
+                    FileOperations.dump_json(data, f, pretty)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
 
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(temp_path, file_path)
 
-            shutil.move(temp_path, file_path)
+            self._with_parent(file_path.parent, write)
+            if durable and sync_dir:
+                FileOperations.fsync_dir(file_path.parent)
             return True, None
 
         except Exception as e:
@@ -47,28 +75,55 @@ class StorageService:
             if not file_path.exists():
                 return None, "File does not exist"
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = self._parse_json(f.read())
 
             return data, None
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             return None, f"Invalid JSON: {str(e)}"
         except Exception as e:
             return None, f"Error loading JSON: {str(e)}"
 
+    def _ensure_parent(self, path: Path) -> None:
+        if path not in self._parents_created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._parents_created.add(path)
+
+    def _with_parent(self, path: Path, operation: Callable[[], Any]) -> Any:
+        self._ensure_parent(path)
+        try:
+            return operation()
+        except FileNotFoundError:
+            self._parents_created.discard(path)
+            self._ensure_parent(path)
+            return operation()
+
+    def _parse_json(self, payload: bytes) -> Any:
+        if self._json_parser is None or len(payload) < self.SIMDJSON_MIN_SIZE:
+            return FileOperations.loads_json(payload)
+
+        with self._json_parser_lock:
+            return self._json_parser.parse(payload, True)
+
+    def _stat(self, filename: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.base_path / filename)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def file_exists(self, filename: str) -> bool:
-        file_path = self.base_path / filename
-        return file_path.exists()
+        return self._stat(filename) is not None
 
     def directory_exists(self, directory: str) -> bool:
-        dir_path = self.base_path / directory
-        return dir_path.exists() and dir_path.is_dir()
+        dir_stat = self._stat(directory)
+        return dir_stat is not None and stat.S_ISDIR(dir_stat.st_mode)
 
     def create_directory(self, directory: str) -> Tuple[bool, Optional[str]]:
         try:
             dir_path = self.base_path / directory
             dir_path.mkdir(parents=True, exist_ok=True)
+            self._parents_created.add(dir_path)
             return True, None
         except Exception as e:
             return False, f"Error creating directory: {str(e)}"
@@ -77,10 +132,18 @@ class StorageService:
         try:
             dir_path = self.base_path / directory
 
-            if not dir_path.exists():
+            if '/' in pattern or '**' in pattern:
+                if not dir_path.exists():
+                    return [], f"Directory does not exist: {directory}"
+                return [f.name for f in dir_path.glob(pattern) if f.is_file()], None
+
+            match = _compile_pattern(pattern).match
+            try:
+                with os.scandir(dir_path) as it:
+                    files = [entry.name for entry in it if match(entry.name) and entry.is_file()]
+            except FileNotFoundError:
                 return [], f"Directory does not exist: {directory}"
 
-            files = [f.name for f in dir_path.glob(pattern) if f.is_file()]
             return files, None
 
         except Exception as e:
@@ -90,10 +153,12 @@ class StorageService:
         try:
             dir_path = self.base_path / directory
 
-            if not dir_path.exists():
+            try:
+                with os.scandir(dir_path) as it:
+                    directories = [entry.name for entry in it if entry.is_dir()]
+            except FileNotFoundError:
                 return [], f"Directory does not exist: {directory}"
 
-            directories = [d.name for d in dir_path.iterdir() if d.is_dir()]
             return directories, None
 
         except Exception as e:
@@ -130,6 +195,11 @@ class StorageService:
             else:
                 dir_path.rmdir()
 
+            self._parents_created = {
+                path for path in self._parents_created
+                if path != dir_path and dir_path not in path.parents
+            }
+
             return True, None
 
         except Exception as e:
@@ -137,31 +207,30 @@ class StorageService:
 
     def get_file_size(self, filename: str) -> Tuple[Optional[int], Optional[str]]:
         try:
-            file_path = self.base_path / filename
+            file_stat = self._stat(filename)
 
-            if not file_path.exists():
+            if file_stat is None:
                 return None, "File does not exist"
 
-            if file_path.is_dir():
+            if stat.S_ISDIR(file_stat.st_mode):
                 return None, "Path is a directory, not a file"
 
-            return file_path.stat().st_size, None
+            return file_stat.st_size, None
 
         except Exception as e:
             return None, f"Error getting file size: {str(e)}"
 
     def get_file_modified_time(self, filename: str) -> Tuple[Optional[datetime], Optional[str]]:
         try:
-            file_path = self.base_path / filename
+            file_stat = self._stat(filename)
 
-            if not file_path.exists():
+            if file_stat is None:
                 return None, "File does not exist"
 
-            if file_path.is_dir():
+            if stat.S_ISDIR(file_stat.st_mode):
                 return None, "Path is a directory, not a file"
 
-            mtime = file_path.stat().st_mtime
-            return datetime.fromtimestamp(mtime), None
+            return datetime.fromtimestamp(file_stat.st_mtime), None
 
         except Exception as e:
             return None, f"Error getting file modified time: {str(e)}"
@@ -177,8 +246,7 @@ class StorageService:
             if source_path.is_dir():
                 return False, "Source is a directory, not a file"
 
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, dest_path)
+            self._with_parent(dest_path.parent, lambda: FileOperations.copy_with_metadata(source_path, dest_path))
 
             return True, None
 
@@ -196,8 +264,7 @@ class StorageService:
             if source_path.is_dir():
                 return False, "Source is a directory, not a file"
 
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(source_path, dest_path)
+            self._with_parent(dest_path.parent, lambda: shutil.move(source_path, dest_path))
 
             return True, None
 
@@ -207,22 +274,32 @@ class StorageService:
     def get_file_info(self, filename: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         try:
             file_path = self.base_path / filename
+            stat_info = self._stat(filename)
 
-            if not file_path.exists():
+            if stat_info is None:
                 return None, "File does not exist"
 
-            stat_info = file_path.stat()
+            from_timestamp = datetime.fromtimestamp
+            modified = from_timestamp(stat_info.st_mtime).isoformat()
+            if stat_info.st_ctime == stat_info.st_mtime:
+                created = modified
+            else:
+                created = from_timestamp(stat_info.st_ctime).isoformat()
+            if stat_info.st_atime == stat_info.st_mtime:
+                accessed = modified
+            else:
+                accessed = from_timestamp(stat_info.st_atime).isoformat()
 
             info = {
                 "filename": filename,
                 "path": str(file_path),
                 "exists": True,
-                "is_file": file_path.is_file(),
-                "is_dir": file_path.is_dir(),
+                "is_file": stat.S_ISREG(stat_info.st_mode),
+                "is_dir": stat.S_ISDIR(stat_info.st_mode),
                 "size_bytes": stat_info.st_size,
-                "created": datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                "accessed": datetime.fromtimestamp(stat_info.st_atime).isoformat()
+                "created": created,
+                "modified": modified,
+                "accessed": accessed
             }
 
             return info, None
@@ -234,55 +311,75 @@ class StorageService:
         try:
             dir_path = self.base_path / directory
 
-            if not dir_path.exists():
+            try:
+                it = os.scandir(dir_path)
+            except FileNotFoundError:
                 return 0, f"Directory does not exist: {directory}"
 
-            now = datetime.now().timestamp()
-            max_age_seconds = max_age_days * 24 * 3600
+            cutoff = datetime.now().timestamp() - max_age_days * 24 * 3600
             deleted_count = 0
 
-            for item in dir_path.iterdir():
-                try:
-                    if item.is_file():
-                        age = now - item.stat().st_mtime
+            with it:
+                for entry in it:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
 
-                        if age > max_age_seconds:
-                            item.unlink()
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.unlink(entry.path)
                             deleted_count += 1
-                except Exception as e:
-                    print(e)
-                    continue
+                    except (FileNotFoundError, PermissionError) as e:
+                        logger.debug("Failed to remove %s: %s", entry.path, e)
+                        continue
 
             return deleted_count, None
 
         except Exception as e:
             return 0, f"Error cleaning up old files: {str(e)}"
 
-    def ensure_file_structure(self, structure: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    def ensure_file_structure(self, structure: Dict[str, Any], fast: bool = False) -> Tuple[bool, Optional[str]]:
         try:
-            for key, value in structure.items():
-                if isinstance(value, dict):
-                    success, error = self.create_directory(key)
-                    if not success:
-                        return False, f"Failed to create directory {key}: {error}"
-
-                    sub_structure = {f"{key}/{sub_key}": sub_value for sub_key, sub_value in value.items()}
-                    success, error = self.ensure_file_structure(sub_structure)
-                    if not success:
-                        return False, error
-                else:
-                    if isinstance(value, (dict, list)):
-                        success, error = self.save_json(key, value)
+            stack = [("", structure)]
+            written: Set[Path] = set()
+
+            while stack:
+                prefix, node = stack.pop()
+                for key, value in reversed(list(node.items())):
+                    path = f"{prefix}/{key}" if prefix else key
+
+                    if isinstance(value, dict):
+                        stack.append((path, value))
+                        if any(isinstance(child, dict) for child in value.values()):
+                            continue
+
+                        success, error = self.create_directory(path)
+                        if not success:
+                            return False, f"Failed to create directory {path}: {error}"
+                    elif isinstance(value, list):
+                        if fast:
+                            file_path = self.base_path / path
+                            payload = FileOperations.dumps_json(value)
+                            self._with_parent(file_path.parent, lambda: file_path.write_bytes(payload))
+                            continue
+
+                        success, error = self.save_json(path, value, sync_dir=False)
                         if not success:
-                            return False, f"Failed to create file {key}: {error}"
+                            return False, f"Failed to create file {path}: {error}"
+                        written.add((self.base_path / path).parent)
                     else:
-                        file_path = self.base_path / key
-                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        file_path = self.base_path / path
+                        text = str(value)
+                        self._with_parent(file_path.parent, lambda: file_path.write_text(text, encoding='utf-8'))
 
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(str(value))
+            for directory in written:
+                FileOperations.fsync_dir(directory)
 
             return True, None
 
         except Exception as e:
             return False, f"Error ensuring file structure: {str(e)}"
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str):
+    return re.compile(translate(pattern))
@@ -1,14 +1,36 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import logging
 import stat
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from smart_repository_manager_core.utils.file_ops import FileOperations
 
+logger = logging.getLogger(__name__)
+
 
 class StructureService:
+    IO_WORKERS = 6
+    SUBDIRECTORIES = ("repositories", "archives", "downloads", "logs", "backups", "temp")
+    README_TEMPLATE = """# Git Repositories - {username}
+
+Created: {created}
+User: {username}
+
+## Directory Structure
+{username}/
+├── repositories/ # Local clones of Git repositories
+├── archives/    # Backup archives and snapshots
+├── downloads/    # Local downloaded repositories
+├── logs/        # Operation logs
+├── backups/     # Manual backups
+└── temp/        # Temporary files (auto-cleaned)
+
+## Managed by Smart Repository Manager
+"""
 
     def __init__(self, base_dir: Optional[Path] = None):
         if base_dir is None:
@@ -16,54 +38,52 @@ class StructureService:
         else:
             self.base_dir = base_dir
 
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._structure_cache: Dict[str, Dict[str, Path]] = {}
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.IO_WORKERS)
+        return self._io_pool
+
     def create_user_structure(self, username: str) -> Dict[str, Path]:
         try:
             user_dir = self.base_dir / username
             user_dir.mkdir(parents=True, exist_ok=True)
 
-            structure = {
-                "user": user_dir,
-                "repositories": user_dir / "repositories",
-                "archives": user_dir / "archives",
-                "downloads": user_dir / "downloads",
-                "logs": user_dir / "logs",
-                "backups": user_dir / "backups",
-                "temp": user_dir / "temp"
-            }
+            structure = self._build_structure(username)
 
-            for name, path in structure.items():
-                if name != "user":
-                    path.mkdir(exist_ok=True)
-                    self._set_permissions(path)
+            for name in self.SUBDIRECTORIES:
+                path = structure[name]
+                path.mkdir(exist_ok=True)
+                self._set_permissions(path)
 
             self._create_readme(username, structure)
-            return structure
+            return dict(structure)
 
         except Exception as e:
-            print(e)
+            logger.warning("Failed to create structure for %s: %s", username, e)
             return {}
 
     def get_user_structure(self, username: str) -> Dict[str, Path]:
-        user_dir = self.base_dir / username
+        structure = self._build_structure(username)
 
-        if not user_dir.exists():
+        if not structure["user"].exists():
             return {}
 
-        return {
-            "user": user_dir,
-            "repositories": user_dir / "repositories",
-            "archives": user_dir / "archives",
-            "downloads": user_dir / "downloads",
-            "logs": user_dir / "logs",
-            "backups": user_dir / "backups",
-            "temp": user_dir / "temp"
-        }
+        return dict(structure)
+
+    def _build_structure(self, username: str) -> Dict[str, Path]:
+        structure = self._structure_cache.get(username)
+        if structure is None:
+            user_dir = self.base_dir / username
+            structure = {"user": user_dir}
+            structure.update((name, user_dir / name) for name in self.SUBDIRECTORIES)
+            self._structure_cache[username] = structure
+        return structure
 
     def get_repository_path(self, username: str, repo_name: str) -> Path:
-        structure = self.get_user_structure(username)
-        if "repositories" in structure:
-            return structure["repositories"] / repo_name
-        return self.base_dir / username / "repositories" / repo_name
+        return self._build_structure(username)["repositories"] / repo_name
 
     def cleanup_temp(self, username: str, max_age_days: int = 7) -> None:
         try:
@@ -72,110 +92,116 @@ class StructureService:
             if not temp_dir.exists():
                 return
 
-            now = datetime.now().timestamp()
-            max_age_seconds = max_age_days * 24 * 3600
-
-            for item in temp_dir.iterdir():
-                try:
-                    stat_info = item.stat()
-                    age = now - stat_info.st_mtime
+            cutoff = datetime.now().timestamp() - max_age_days * 24 * 3600
 
-                    if age > max_age_seconds:
-                        FileOperations.safe_remove(item)
-                except Exception as e:
-                    print(e)
-                    continue
+            with os.scandir(temp_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            FileOperations.safe_remove(Path(entry.path))
+                    except (FileNotFoundError, PermissionError) as e:
+                        logger.debug("Failed to clean up %s: %s", entry.path, e)
+                        continue
 
         except Exception as e:
-            print(e)
-            pass
+            logger.warning("Failed to clean up temp directory for %s: %s", username, e)
 
     def get_structure_info(self, username: str) -> Dict[str, Dict]:
         structure = self.get_user_structure(username)
         info = {}
 
+        walks = {
+            name: self._get_io_pool().submit(self._walk_size, path)
+            for name, path in structure.items()
+        }
+
         for name, path in structure.items():
-            if path.exists():
-                try:
-                    size = 0
-                    count = 0
-
-                    if path.is_dir():
-                        for item in path.rglob('*'):
-                            if item.is_file():
-                                size += item.stat().st_size
-                                count += 1
-
-                    info[name] = {
-                        "path": str(path),
-                        "exists": True,
-                        "item_count": count,
-                        "size_bytes": size,
-                        "size_mb": size / (1024 * 1024)
-                    }
-                except Exception as e:
-                    print(e)
-                    info[name] = {
-                        "path": str(path),
-                        "exists": True,
-                        "item_count": 0,
-                        "size_bytes": 0,
-                        "size_mb": 0
-                    }
-            else:
-                info[name] = {
-                    "path": str(path),
-                    "exists": False,
-                    "item_count": 0,
-                    "size_bytes": 0,
-                    "size_mb": 0
-                }
+            try:
+                size, count = walks[name].result()
+                exists = True
+            except NotADirectoryError:
+                size, count, exists = 0, 0, True
+            except FileNotFoundError as e:
+                size, count, exists = 0, 0, path.exists()
+                if exists:
+                    logger.warning("Failed to measure %s: %s", path, e)
+            except Exception as e:
+                logger.warning("Failed to measure %s: %s", path, e)
+                size, count, exists = 0, 0, True
+
+            info[name] = {
+                "path": str(path),
+                "exists": exists,
+                "item_count": count,
+                "size_bytes": size,
+                "size_mb": size / (1024 * 1024) if size else 0
+            }
 
         return info
 
+    @staticmethod
+    def _walk_size(root: Path) -> Tuple[int, int]:
+        size = 0
+        count = 0
+        root_path = str(root)
+        stack = [root_path]
+
+        while stack:
+            path = stack.pop()
+            try:
+                it = os.scandir(path)
+            except OSError as e:
+                if path == root_path:
+                    raise
+                logger.debug("Skipping unreadable directory %s: %s", path, e)
+                continue
+
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            size += entry.stat().st_size
+                            count += 1
+                    except OSError as e:
+                        logger.debug("Skipping %s: %s", entry.path, e)
+
+        return size, count
+
     def ensure_user_dir(self, username: str) -> bool:
         try:
             user_dir = self.base_dir / username
             user_dir.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            print(e)
+            logger.warning("Failed to create user directory for %s: %s", username, e)
             return False
 
     def _set_permissions(self, path: Path) -> None:
         try:
             os.chmod(path, stat.S_IRWXU)
         except Exception as e:
-            print(e)
-            pass
+            logger.warning("Failed to set permissions on %s: %s", path, e)
 
     def _create_readme(self, username: str, structure: Dict[str, Path]) -> None:
         try:
             readme_path = structure["user"] / "README.md"
 
-            if not readme_path.exists():
-                content = f"""# Git Repositories - {username}
+            content = self.README_TEMPLATE.format(
+                username=username,
+                created=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ).encode('utf-8')
 
-Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-User: {username}
-
-## Directory Structure
-{username}/
-├── repositories/ # Local clones of Git repositories
-├── archives/    # Backup archives and snapshots
-├── downloads/    # Local downloaded repositories
-├── logs/        # Operation logs
-├── backups/     # Manual backups
-└── temp/        # Temporary files (auto-cleaned)
-
-## Managed by Smart Repository Manager
-"""
-
-                with open(readme_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            try:
+                fd = os.open(readme_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, stat.S_IRUSR | stat.S_IWUSR)
+            except FileExistsError:
+                return
 
-                os.chmod(readme_path, stat.S_IRUSR | stat.S_IWUSR)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
 
         except Exception as e:
-            print(e)
-            pass
+            logger.warning("Failed to create README for %s: %s", username, e)
@@ -1,20 +1,34 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import asyncio
+import os
+import random
 import time
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Any, Tuple
+from typing import List, Dict, Optional, Callable, Any, Set, Tuple
 from datetime import datetime
 
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
 
+from smart_repository_manager_core.core.async_git_operations import AsyncGitCloneOperation, AsyncGitPullOperation
+from smart_repository_manager_core.core.git_operations import fetch_jobs_options
 from smart_repository_manager_core.core.git_status import GitStatusChecker
+from smart_repository_manager_core.core.health_cache import HealthCache
 from smart_repository_manager_core.core.models.repository import Repository
+from smart_repository_manager_core.core.repo_index import RepoIndex, repo_index
 from smart_repository_manager_core.core.models.user import User
 from smart_repository_manager_core.services.git_service import GitService
 from smart_repository_manager_core.services.structure_service import StructureService
 from smart_repository_manager_core.utils.helpers import Helpers
+from smart_repository_manager_core.utils.validators import Validators
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 
 class SyncResult:
@@ -60,28 +74,56 @@ class SyncResult:
 
 
 class SyncService:
+    GIT_CHECK_WORKERS = 16
 
-    def __init__(self, token: Optional[str] = None, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, token: Optional[str] = None, timeout: int = 30, max_retries: int = 3,
+                 max_workers: int = 8, max_backoff: float = 30):
         self.token = token
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.max_workers = max(1, max_workers)
         self.git_service = GitService(token=token, timeout=timeout)
         self.structure_service = StructureService()
-        self._callbacks: Dict[str, List[Callable]] = {}
+        self._callbacks: Dict[str, Tuple[Callable, ...]] = {}
+        self._callbacks_lock = threading.RLock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._check_pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._health_caches: Dict[Path, HealthCache] = {}
+        self._health_caches_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._pool_lock:
+            pools = (self._pool, self._check_pool)
+            self._pool = None
+            self._check_pool = None
+
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=True)
+
+    def __enter__(self) -> 'SyncService':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def register_callback(self, event: str, callback: Callable) -> None:
-        if event not in self._callbacks:
-            self._callbacks[event] = []
-        self._callbacks[event].append(callback)
+        with self._callbacks_lock:
+            self._callbacks[event] = self._callbacks.get(event, ()) + (callback,)
 
     def _emit(self, event: str, *args, **kwargs) -> None:
-        if event in self._callbacks:
-            for callback in self._callbacks[event]:
+        callbacks = self._callbacks.get(event)
+        if not callbacks:
+            return
+
+        with self._callbacks_lock:
+            for callback in callbacks:
                 try:
                     callback(*args, **kwargs)
                 except Exception as e:
                     print(e)
-                    pass
 
     def sync_user_repositories(
             self,
@@ -91,9 +133,94 @@ class SyncService:
             auto_repair: bool = True,
             health_check: bool = True
     ) -> SyncResult:
+        result, repos_path, start_time = self._start_sync(user, repositories, operation)
+        if repos_path is None:
+            return result
+
+        health_results = self._run_health_pre_pass(result, repositories, repos_path) if health_check else {}
+
+        pool = self._get_pool()
+        future_to_repo = {
+            pool.submit(
+                self._sync_one_repo,
+                repo,
+                i,
+                result.total,
+                repos_path,
+                health_results.get(repo.name) if health_check else None,
+                operation,
+                auto_repair
+            ): repo
+            for i, repo in enumerate(repositories)
+        }
+
+        for future in concurrent.futures.as_completed(future_to_repo):
+            repo = future_to_repo[future]
+            try:
+                outcome, message = future.result()
+            except Exception as e:
+                outcome, message = "failed", f"Exception: {str(e)}"
+                self._emit("repo_failed", repo, message)
+            self._record_outcome(result, repo, outcome, message)
+
+        return self._finish_sync(result, repos_path, start_time)
+
+    async def sync_user_repositories_async(
+            self,
+            user: User,
+            repositories: List[Repository],
+            operation: str = "sync",
+            auto_repair: bool = True,
+            health_check: bool = True,
+            concurrency: int = 32
+    ) -> SyncResult:
+        result, repos_path, start_time = self._start_sync(user, repositories, operation)
+        if repos_path is None:
+            return result
+
+        loop = asyncio.get_event_loop()
+
+        health_results = {}
+        if health_check:
+            health_results = await loop.run_in_executor(
+                None, self._run_health_pre_pass, result, repositories, repos_path
+            )
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _bounded(i: int, repo: Repository) -> Tuple[Repository, str, str]:
+            async with semaphore:
+                try:
+                    outcome, message = await self._sync_one_repo_async(
+                        repo,
+                        i,
+                        result.total,
+                        repos_path,
+                        health_results.get(repo.name) if health_check else None,
+                        operation,
+                        auto_repair
+                    )
+                except Exception as e:
+                    outcome, message = "failed", f"Exception: {str(e)}"
+                    self._emit("repo_failed", repo, message)
+                return repo, outcome, message
+
+        for task in asyncio.as_completed([_bounded(i, repo) for i, repo in enumerate(repositories)]):
+            repo, outcome, message = await task
+            self._record_outcome(result, repo, outcome, message)
+
+        return self._finish_sync(result, repos_path, start_time)
+
+    def _start_sync(
+            self,
+            user: User,
+            repositories: List[Repository],
+            operation: str
+    ) -> Tuple[SyncResult, Optional[Path], float]:
+        start_time = time.time()
         result = SyncResult()
         result.total = len(repositories)
-        result.start_time = datetime.now().isoformat()
+        result.start_time = datetime.fromtimestamp(start_time).isoformat()
 
         self._emit("sync_started", user, result.total, operation)
 
@@ -102,76 +229,163 @@ class SyncService:
             result.failed = result.total
             result.end_time = datetime.now().isoformat()
             self._emit("sync_finished", result)
-            return result
+            return result, None, start_time
 
-        repos_path = structure["repositories"]
-        start_time = time.time()
+        return result, structure["repositories"], start_time
+
+    def _finish_sync(self, result: SyncResult, repos_path: Path, start_time: float) -> SyncResult:
+        self._get_health_cache(repos_path).flush()
+
+        end_time = time.time()
+        result.duration = end_time - start_time
+        result.end_time = datetime.fromtimestamp(end_time).isoformat()
+
+        self._emit("sync_finished", result)
+        return result
 
+    def _run_health_pre_pass(
+            self,
+            result: SyncResult,
+            repositories: List[Repository],
+            repos_path: Path
+    ) -> Dict[str, Dict[str, Any]]:
         health_results = {}
-        if health_check:
-            self._emit("health_check_started")
-            for repo in repositories:
-                health_status = self._check_repository_health(repo, repos_path)
-                health_results[repo.name] = health_status
-                result.health_stats[health_status["status"]] += 1
-                self._emit("health_checked", repo.name, health_status["status"])
-            self._emit("health_check_completed", result.health_stats)
-
-        for i, repo in enumerate(repositories):
-            clone_url = repo.clone_url or repo.html_url.replace("github.com", "github.com").rstrip('/') + '.git'
 
-            if not clone_url:
-                result.failed += 1
-                result.failed_repos[repo.name] = "No clone URL"
-                self._emit("repo_failed", repo, "No clone URL")
-                continue
+        self._emit("health_check_started")
+        for repo, health_status in zip(repositories, self._collect_health(repositories, repos_path)):
+            health_results[repo.name] = health_status
+            result.health_stats[health_status["status"]] += 1
+            self._emit("health_checked", repo.name, health_status["status"])
+        self._emit("health_check_completed", result.health_stats)
 
-            self._emit("repo_started", repo, i, result.total)
+        return health_results
 
-            repo_path = repos_path / repo.name
-            health_status = health_results.get(repo.name) if health_check else None
+    def _collect_health(self, repositories: List[Repository], repos_path: Path) -> List[Dict[str, Any]]:
+        if not repositories:
+            return []
 
-            operation_type = self._determine_smart_operation(
-                repo, repo_path, operation, health_status
-            )
+        try:
+            with os.scandir(repos_path) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
+        except OSError:
+            existing = None
+
+        statuses = list(self._get_pool().map(
+            lambda repo: self._check_repository_health(repo, repos_path, existing),
+            repositories
+        ))
+
+        self._get_health_cache(repos_path).flush()
+        return statuses
+
+    @staticmethod
+    def _record_outcome(result: SyncResult, repo: Repository, outcome: str, message: str) -> None:
+        if outcome == "successful":
+            result.successful += 1
+        elif outcome == "repaired":
+            result.repaired += 1
+            result.repaired_repos[repo.name] = message
+        elif outcome == "skipped":
+            result.skipped += 1
+            result.skipped_repos[repo.name] = message
+        else:
+            result.failed += 1
+            result.failed_repos[repo.name] = message
 
-            if operation_type == "skip":
-                result.skipped += 1
-                result.skipped_repos[repo.name] = "Already up to date"
-                self._emit("repo_skipped", repo, "Already up to date")
-                continue
+    def _sync_one_repo(
+            self,
+            repo: Repository,
+            index: int,
+            total: int,
+            repos_path: Path,
+            health_status: Optional[Dict[str, Any]],
+            operation: str,
+            auto_repair: bool
+    ) -> Tuple[str, str]:
+        clone_url = repo.clone_url or repo.html_url.replace("github.com", "github.com").rstrip('/') + '.git'
 
-            success, message, attempts = self._execute_with_retries(
-                operation_type, clone_url, repo_path, repo.name, auto_repair
-            )
+        if not clone_url:
+            self._emit("repo_failed", repo, "No clone URL")
+            return "failed", "No clone URL"
 
-            if success:
-                if "repaired" in message.lower() or "re-cloned" in message.lower():
-                    result.repaired += 1
-                    result.repaired_repos[repo.name] = f"{message} (attempts: {attempts})"
-                    self._emit("repo_repaired", repo, message, attempts)
-                else:
-                    result.successful += 1
-                    self._emit("repo_completed", repo, success, message, attempts)
-                repo.need_update = False
-                repo.local_exists = True
-            else:
-                result.failed += 1
-                result.failed_repos[repo.name] = f"{message} (attempts: {attempts})"
-                self._emit("repo_failed", repo, message, attempts)
+        self._emit("repo_started", repo, index, total)
 
-        result.duration = time.time() - start_time
-        result.end_time = datetime.now().isoformat()
+        repo_path = repos_path / repo.name
 
-        self._emit("sync_finished", result)
-        return result
+        operation_type = self._determine_smart_operation(
+            repo, repo_path, operation, health_status
+        )
+
+        if operation_type == "skip":
+            self._emit("repo_skipped", repo, "Already up to date")
+            return "skipped", "Already up to date"
+
+        success, message, attempts = self._execute_with_retries(
+            operation_type, clone_url, repo_path, repo.name, auto_repair
+        )
+
+        return self._finish_repo(repo, success, message, attempts)
+
+    async def _sync_one_repo_async(
+            self,
+            repo: Repository,
+            index: int,
+            total: int,
+            repos_path: Path,
+            health_status: Optional[Dict[str, Any]],
+            operation: str,
+            auto_repair: bool
+    ) -> Tuple[str, str]:
+        clone_url = repo.clone_url or repo.html_url.replace("github.com", "github.com").rstrip('/') + '.git'
+
+        if not clone_url:
+            self._emit("repo_failed", repo, "No clone URL")
+            return "failed", "No clone URL"
 
-    def _check_repository_health(self, repo: Repository, repos_path: Path) -> Dict[str, Any]:
+        self._emit("repo_started", repo, index, total)
+
+        repo_path = repos_path / repo.name
+
+        loop = asyncio.get_event_loop()
+        operation_type = await loop.run_in_executor(
+            None, self._determine_smart_operation, repo, repo_path, operation, health_status
+        )
+
+        if operation_type == "skip":
+            self._emit("repo_skipped", repo, "Already up to date")
+            return "skipped", "Already up to date"
+
+        success, message, attempts = await self._execute_with_retries_async(
+            operation_type, clone_url, repo_path, repo.name, auto_repair
+        )
+
+        return self._finish_repo(repo, success, message, attempts)
+
+    def _finish_repo(self, repo: Repository, success: bool, message: str, attempts: int) -> Tuple[str, str]:
+        if not success:
+            self._emit("repo_failed", repo, message, attempts)
+            return "failed", f"{message} (attempts: {attempts})"
+
+        repo.need_update = False
+        repo.local_exists = True
+
+        if "repaired" in message.lower() or "re-cloned" in message.lower():
+            self._emit("repo_repaired", repo, message, attempts)
+            return "repaired", f"{message} (attempts: {attempts})"
+
+        self._emit("repo_completed", repo, success, message, attempts)
+        return "successful", message
+
+    def _check_repository_health(self, repo: Repository, repos_path: Path,
+                                 existing: Optional[Set[str]] = None) -> Dict[str, Any]:
         repo_path = repos_path / repo.name
+        exists = repo.name in existing if existing is not None else repo_path.exists()
 
         health_result = {
             "name": repo.name,
-            "exists": repo_path.exists(),
+            "exists": exists,
             "is_git_repo": False,
             "health_checks": [],
             "status": "unknown",
@@ -179,12 +393,17 @@ class SyncService:
             "recommendations": []
         }
 
-        if not repo_path.exists():
+        if not exists:
             health_result["status"] = "not_exists"
             health_result["needs_repair"] = True
             health_result["recommendations"].append("Repository does not exist - needs cloning")
             return health_result
 
+        cache = self._get_health_cache(repos_path)
+        cached = cache.get(repo_path)
+        if cached is not None:
+            return cached
+
         if not (repo_path / '.git').exists():
             health_result["status"] = "broken"
             health_result["needs_repair"] = True
@@ -193,6 +412,21 @@ class SyncService:
 
         health_result["is_git_repo"] = True
 
+        health_result = self._probe_repository_health(repo_path, health_result)
+        cache.put(repo_path, health_result)
+        return health_result
+
+    def _probe_repository_health(self, repo_path: Path, health_result: Dict[str, Any]) -> Dict[str, Any]:
+        healthy, output = self._fast_health_probe(repo_path)
+        if healthy:
+            health_result["health_checks"].append({
+                "name": "git_probe",
+                "success": True,
+                "output": output[:100]
+            })
+            health_result["status"] = "healthy"
+            return health_result
+
         checks = [
             ("git_dir", ["git", "-C", str(repo_path), "rev-parse", "--git-dir"]),
             ("git_log", ["git", "-C", str(repo_path), "log", "--oneline", "-1"]),
@@ -200,16 +434,13 @@ class SyncService:
             ("git_status", ["git", "-C", str(repo_path), "status", "--porcelain"]),
         ]
 
+        pool = self._get_check_pool()
+        futures = [pool.submit(self._run_git_check, command) for _, command in checks]
+
         passed_checks = 0
-        for check_name, command in checks:
+        for (check_name, _), future in zip(checks, futures):
             try:
-                result = subprocess.run(
-                    command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=5
-                )
+                result = future.result()
 
                 check_result = {
                     "name": check_name,
@@ -249,6 +480,38 @@ class SyncService:
 
         return health_result
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sync')
+            return self._pool
+
+    def _get_check_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._check_pool is None:
+                self._check_pool = ThreadPoolExecutor(max_workers=self.GIT_CHECK_WORKERS,
+                                                      thread_name_prefix='sync-check')
+            return self._check_pool
+
+    def _get_health_cache(self, repos_path: Path) -> HealthCache:
+        user_dir = repos_path.parent
+        with self._health_caches_lock:
+            cache = self._health_caches.get(user_dir)
+            if cache is None:
+                cache = HealthCache(user_dir / ".cache")
+                self._health_caches[user_dir] = cache
+            return cache
+
+    @staticmethod
+    def _run_git_check(command: List[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=5
+        )
+
     def _determine_smart_operation(
             self,
             repo: Repository,
@@ -270,9 +533,6 @@ class SyncService:
         if health_status["status"] == "partially_broken":
             return "repair"
 
-        if not repo_path.exists() or not (repo_path / '.git').exists():
-            return "clone"
-
         if repo.pushed_at:
             needs_update = GitStatusChecker.needs_update(repo_path, repo.pushed_at)
             if needs_update:
@@ -287,6 +547,19 @@ class SyncService:
             repo_path: Path,
             repo_name: str,
             auto_repair: bool
+    ) -> Tuple[bool, str, int]:
+        try:
+            return self._run_with_retries(operation_type, clone_url, repo_path, repo_name, auto_repair)
+        finally:
+            self._get_health_cache(repo_path.parent).invalidate(repo_path)
+
+    def _run_with_retries(
+            self,
+            operation_type: str,
+            clone_url: str,
+            repo_path: Path,
+            repo_name: str,
+            auto_repair: bool
     ) -> Tuple[bool, str, int]:
         last_error = ""
 
@@ -315,42 +588,122 @@ class SyncService:
                         return True, f"Auto-repaired: {repair_message}", attempt + 1
                     last_error = repair_message
 
-                if attempt < self.max_retries:
-                    wait_time = min(2 ** attempt, 10)
-                    time.sleep(wait_time)
+            except Exception as e:
+                last_error = f"Exception: {str(e)}"
+
+            if attempt < self.max_retries:
+                time.sleep(self._backoff(attempt))
+
+        return False, f"Failed after {self.max_retries} attempts: {last_error}", self.max_retries
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(2 ** attempt, self.max_backoff))
+
+    async def _execute_with_retries_async(
+            self,
+            operation_type: str,
+            clone_url: str,
+            repo_path: Path,
+            repo_name: str,
+            auto_repair: bool
+    ) -> Tuple[bool, str, int]:
+        try:
+            return await self._run_with_retries_async(operation_type, clone_url, repo_path, repo_name, auto_repair)
+        finally:
+            self._get_health_cache(repo_path.parent).invalidate(repo_path)
+
+    async def _run_with_retries_async(
+            self,
+            operation_type: str,
+            clone_url: str,
+            repo_path: Path,
+            repo_name: str,
+            auto_repair: bool
+    ) -> Tuple[bool, str, int]:
+        loop = asyncio.get_event_loop()
+        last_error = ""
+
+        for attempt in range(1, self.max_retries + 1):
+            self._emit("operation_attempt", repo_name, operation_type, attempt)
+
+            try:
+                if operation_type == "clone":
+                    success, message = await self._execute_clone_async(clone_url, repo_path)
+                elif operation_type == "pull":
+                    success, message = await self._execute_pull_async(repo_path)
+                elif operation_type == "repair":
+                    success, message = await loop.run_in_executor(
+                        None, self._execute_repair, clone_url, repo_path, repo_name
+                    )
+                else:
+                    return False, f"Unknown operation: {operation_type}", attempt
+
+                if success:
+                    return True, message, attempt
+
+                last_error = message
+
+                if auto_repair and operation_type != "repair":
+                    self._emit("auto_repair_triggered", repo_name)
+                    repair_success, repair_message = await loop.run_in_executor(
+                        None, self._execute_repair, clone_url, repo_path, repo_name
+                    )
+                    if repair_success:
+                        return True, f"Auto-repaired: {repair_message}", attempt + 1
+                    last_error = repair_message
 
             except Exception as e:
                 last_error = f"Exception: {str(e)}"
-                if attempt < self.max_retries:
-                    time.sleep(2)
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt))
 
         return False, f"Failed after {self.max_retries} attempts: {last_error}", self.max_retries
 
+    async def _execute_clone_async(self, clone_url: str, repo_path: Path) -> Tuple[bool, str]:
+        if not Validators.validate_path(repo_path)[0]:
+            return False, "Invalid target path"
+
+        operation = AsyncGitCloneOperation(timeout=self.timeout)
+        result = await operation.execute(clone_url, repo_path, self.token)
+
+        if result.success:
+            return True, "Cloned successfully"
+
+        return False, result.error or "Clone failed"
+
+    async def _execute_pull_async(self, repo_path: Path) -> Tuple[bool, str]:
+        if not (repo_path / '.git' / 'HEAD').exists():
+            return False, "Repository is unhealthy, cannot pull"
+
+        operation = AsyncGitPullOperation(timeout=self.timeout)
+        result = await operation.execute(repo_path, self.token)
+
+        if result.success:
+            if "Already up to date" in (result.message or ""):
+                return True, "Already up to date"
+            return True, "Updated successfully"
+
+        return False, result.error or "Pull failed"
+
     def _execute_clone(self, clone_url: str, repo_path: Path) -> Tuple[bool, str]:
         result = self.git_service.clone_repository(clone_url, repo_path, self.token)
 
         if result.success:
-            if self._verify_repository_health(repo_path):
-                return True, "Cloned successfully"
-            else:
-                self._cleanup_repository(repo_path)
-                return False, "Clone succeeded but repository is unhealthy"
+            return True, "Cloned successfully"
 
         return False, result.error or "Clone failed"
 
     def _execute_pull(self, repo_path: Path) -> Tuple[bool, str]:
-        if not self._verify_repository_health(repo_path):
+        if not (repo_path / '.git' / 'HEAD').exists():
             return False, "Repository is unhealthy, cannot pull"
 
         result = self.git_service.pull_repository(repo_path, self.token)
 
         if result.success:
-            if self._verify_repository_health(repo_path):
-                if "Already up to date" in (result.message or ""):
-                    return True, "Already up to date"
-                return True, "Updated successfully"
-            else:
-                return False, "Pull succeeded but repository became unhealthy"
+            if "Already up to date" in (result.message or ""):
+                return True, "Already up to date"
+            return True, "Updated successfully"
 
         return False, result.error or "Pull failed"
 
@@ -369,13 +722,8 @@ class SyncService:
         result = self.git_service.clone_repository(clone_url, repo_path, self.token)
 
         if result.success:
-            if self._verify_repository_health(repo_path):
-                self._emit("repair_success", repo_name, "Re-cloned successfully")
-                return True, "Re-cloned successfully"
-            else:
-                self._cleanup_repository(repo_path)
-                self._emit("repair_failed", repo_name, "Re-cloned but unhealthy")
-                return False, "Re-cloned but repository is still unhealthy"
+            self._emit("repair_success", repo_name, "Re-cloned successfully")
+            return True, "Re-cloned successfully"
 
         self._emit("repair_failed", repo_name, result.error)
         return False, f"Re-clone failed: {result.error}"
@@ -401,18 +749,19 @@ class SyncService:
                     return False, "Failed to reinitialize git"
 
             subprocess.run(
-                ['git', '-C', str(repo_path), 'fetch', '--all'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                ['git', '-C', str(repo_path), 'fetch', '--all', *fetch_jobs_options()],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
 
             subprocess.run(
                 ['git', '-C', str(repo_path), 'reset', '--hard', 'origin/HEAD'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
+            repo_index.invalidate(repo_path)
 
             if self._verify_repository_health(repo_path):
                 return True, "Fixed with fetch and reset"
@@ -423,27 +772,48 @@ class SyncService:
             return False, f"Fix error: {str(e)}"
 
     def _verify_repository_health(self, repo_path: Path) -> bool:
-        try:
-            result1 = subprocess.run(
-                ['git', '-C', str(repo_path), 'rev-parse', '--git-dir'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
-            )
+        return self._fast_health_probe(repo_path)[0]
+
+    @staticmethod
+    def _fast_health_probe(repo_path: Path) -> Tuple[bool, str]:
+        if pygit2 is not None:
+            return SyncService._read_health(repo_path)
+        return SyncService._query_health(repo_path)
 
-            result2 = subprocess.run(
-                ['git', '-C', str(repo_path), 'log', '--oneline', '-1'],
+    @staticmethod
+    def _read_health(repo_path: Path) -> Tuple[bool, str]:
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            commit = repo.head.peel(pygit2.Commit)
+            return True, f"{repo.path}\n{repo.workdir}\n{commit.id}\n"
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            return False, str(e)
+
+    @staticmethod
+    def _query_health(repo_path: Path) -> Tuple[bool, str]:
+        try:
+            result = subprocess.run(
+                SyncService._health_probe_command(repo_path),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=5
             )
 
-            return result1.returncode == 0 and result2.returncode == 0
+            return SyncService._parse_health_probe(result.returncode, result.stdout, result.stderr)
         except Exception as e:
             print(e)
-            return False
+            return False, str(e)
+
+    @staticmethod
+    def _health_probe_command(repo_path: Path) -> List[str]:
+        return ['git', '-C', str(repo_path), 'rev-parse', '--git-dir', '--show-toplevel', 'HEAD^{commit}']
+
+    @staticmethod
+    def _parse_health_probe(returncode: int, stdout: str, stderr: str) -> Tuple[bool, str]:
+        lines = stdout.splitlines()
+        healthy = returncode == 0 and len(lines) == 3 and all(lines)
+        return healthy, stdout if healthy else stderr
 
     def _cleanup_repository(self, repo_path: Path) -> bool:
         try:
@@ -547,29 +917,32 @@ class SyncService:
         if not repos_to_check:
             return results
 
-        with ThreadPoolExecutor(max_workers=min(10, len(repos_to_check))) as executor:
-            future_to_repo = {}
+        use_index = len(repos_to_check) >= RepoIndex.MIN_REPOSITORIES
 
-            for repo, repo_path in repos_to_check:
-                future = executor.submit(
-                    GitStatusChecker.needs_update,
-                    repo_path,
-                    repo.pushed_at
-                )
-                future_to_repo[future] = repo.name
+        pool = self._get_pool()
+        future_to_repo = {}
 
-            for future in concurrent.futures.as_completed(future_to_repo):
-                repo_name = future_to_repo[future]
-                try:
-                    needs_update = future.result(timeout=30)
+        for repo, repo_path in repos_to_check:
+            future = pool.submit(
+                GitStatusChecker.needs_update,
+                repo_path,
+                repo.pushed_at,
+                use_index
+            )
+            future_to_repo[future] = repo.name
 
-                    if needs_update:
-                        results[repo_name] = (True, "Update needed")
-                    else:
-                        results[repo_name] = (False, "Up to date")
+        for future in concurrent.futures.as_completed(future_to_repo):
+            repo_name = future_to_repo[future]
+            try:
+                needs_update = future.result(timeout=30)
 
-                except Exception as e:
-                    results[repo_name] = (True, f"Check failed: {str(e)}")
+                if needs_update:
+                    results[repo_name] = (True, "Update needed")
+                else:
+                    results[repo_name] = (False, "Up to date")
+
+            except Exception as e:
+                results[repo_name] = (True, f"Check failed: {str(e)}")
 
         return results
 
@@ -582,7 +955,9 @@ class SyncService:
         if not structure or "repositories" not in structure:
             return {"error": "Directory structure not found"}
 
-        return self._check_repository_health(repo, structure["repositories"])
+        health = self._check_repository_health(repo, structure["repositories"])
+        self._get_health_cache(structure["repositories"]).flush()
+        return health
 
     def batch_health_check(
             self,
@@ -605,8 +980,7 @@ class SyncService:
 
         repos_path = structure["repositories"]
 
-        for repo in repositories:
-            health = self._check_repository_health(repo, repos_path)
+        for repo, health in zip(repositories, self._collect_health(repositories, repos_path)):
             results[repo.name] = health
             stats[health["status"]] += 1
 
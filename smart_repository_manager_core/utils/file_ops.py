@@ -1,8 +1,17 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
 import json
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import BinaryIO, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+SYNC_FLAG = getattr(os, 'O_DSYNC', 0)
 
 
 class FileOperations:
@@ -19,28 +28,85 @@ class FileOperations:
     @staticmethod
     def read_json(path: Path) -> Tuple[Optional[Dict], bool]:
         try:
-            if not path.exists():
-                return None, False
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = FileOperations.loads_json(path.read_bytes())
             return data, True
+        except FileNotFoundError:
+            return None, False
         except Exception as e:
             print(e)
             return None, False
 
     @staticmethod
-    def write_json(path: Path, data: Dict[str, Any]) -> bool:
+    def loads_json(payload: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
+
+    @staticmethod
+    def dumps_json(data: Dict[str, Any], pretty: bool = True) -> bytes:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option)
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def dump_json(data: Dict[str, Any], stream: BinaryIO, pretty: bool = True) -> None:
+        if orjson is not None:
+            stream.write(FileOperations.dumps_json(data, pretty))
+            return
+        if pretty:
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        else:
+            encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+        for chunk in encoder.iterencode(data):
+            stream.write(chunk.encode('utf-8'))
+
+    @staticmethod
+    def write_json(path: Path, data: Dict[str, Any], durable: bool = False) -> bool:
+        try:
+            return FileOperations.write_bytes(path, FileOperations.dumps_json(data), durable)
+        except Exception as e:
+            print(e)
+            return False
+
+    @staticmethod
+    def write_bytes(path: Path, payload: bytes, durable: bool = False) -> bool:
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            temp = path.with_suffix('.tmp')
-            with open(temp, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            shutil.move(temp, path)
+            temp = path.parent / (path.name + '.tmp')
+            flags = WRITE_FLAGS | (SYNC_FLAG if durable else 0)
+            fd = os.open(temp, flags, 0o666)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                if durable and not SYNC_FLAG:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp, path)
+            if durable:
+                FileOperations.fsync_dir(path.parent)
             return True
         except Exception as e:
             print(e)
             return False
 
+    @staticmethod
+    def fsync_dir(path: Path) -> None:
+        if os.name != 'posix':
+            return
+
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     @staticmethod
     def safe_remove(path: Path) -> bool:
         try:
@@ -57,8 +123,37 @@ class FileOperations:
     @staticmethod
     def copy_file(source: Path, destination: Path) -> bool:
         try:
-            shutil.copy2(source, destination)
+            FileOperations.copy_with_metadata(source, destination)
             return True
         except Exception as e:
             print(e)
             return False
+
+    @staticmethod
+    def copy_with_metadata(source: Path, destination: Path) -> None:
+        if os.path.isdir(destination):
+            destination = Path(destination) / Path(source).name
+
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+
+        if not FileOperations._copy_file_range(source, destination):
+            shutil.copyfile(source, destination)
+        shutil.copystat(source, destination)
+
+    @staticmethod
+    def _copy_file_range(source: Path, destination: Path) -> bool:
+        if not hasattr(os, 'copy_file_range'):
+            return False
+
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return True
+        except OSError:
+            return False
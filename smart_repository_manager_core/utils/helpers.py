@@ -1,7 +1,11 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import sys
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List
 
+ISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 
 class Helpers:
 
@@ -11,14 +15,13 @@ class Helpers:
             return f"{seconds * 1000:.0f}ms"
         elif seconds < 60:
             return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
+
+        minutes, secs = divmod(int(seconds), 60)
+        if minutes < 60:
             return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m"
+
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
 
     @staticmethod
     def format_size(size_bytes: int) -> str:
@@ -33,14 +36,7 @@ class Helpers:
 
     @staticmethod
     def parse_github_date(date_str: str) -> datetime:
-        if date_str.endswith('Z'):
-            date_str = date_str.replace('Z', '+00:00')
-
-        dt = datetime.fromisoformat(date_str)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-
-        return dt
+        return _parse_github_date(date_str)
 
     @staticmethod
     def calculate_time_difference(github_date: str, local_date: datetime) -> timedelta:
@@ -54,17 +50,28 @@ class Helpers:
 
     @staticmethod
     def deduplicate_list(items: List[Dict], key: str = 'id') -> List[Dict]:
-        seen = set()
-        unique = []
+        unique = {}
+        setdefault = unique.setdefault
 
         for item in items:
             item_key = item.get(key)
-            if item_key and item_key not in seen:
-                seen.add(item_key)
-                unique.append(item)
+            if item_key:
+                setdefault(item_key, item)
 
-        return unique
+        return list(unique.values())
 
     @staticmethod
     def get_timestamp() -> str:
         return datetime.now().isoformat()
+
+
+@lru_cache(maxsize=8192)
+def _parse_github_date(date_str: str) -> datetime:
+    if not ISOFORMAT_ACCEPTS_Z and date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+
+    dt = datetime.fromisoformat(date_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt
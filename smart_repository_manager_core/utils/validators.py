@@ -1,8 +1,13 @@
 # Copyright (©) 2026, Alexander Suvorov. All rights reserved.
+import re
 from typing import Optional, Tuple
-from datetime import datetime
 from pathlib import Path
 
+from smart_repository_manager_core.utils.helpers import Helpers
+
+TOKEN_PATTERN = re.compile(r'\w{20,}')
+USERNAME_PATTERN = re.compile(r'[A-Za-z0-9-]{1,39}')
+
 
 class Validators:
 
@@ -10,18 +15,13 @@ class Validators:
     def validate_token(token: str) -> bool:
         if not token or not isinstance(token, str):
             return False
-        if len(token) < 20:
-            return False
-        return all(c.isalnum() or c == '_' for c in token)
+        return TOKEN_PATTERN.fullmatch(token) is not None
 
     @staticmethod
     def validate_username(username: str) -> bool:
         if not username or not isinstance(username, str):
             return False
-        if len(username) < 1 or len(username) > 39:
-            return False
-        valid_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-")
-        return all(c in valid_chars for c in username)
+        return USERNAME_PATTERN.fullmatch(username) is not None
 
     @staticmethod
     def validate_repo_name(repo_name: str) -> bool:
@@ -54,9 +54,7 @@ class Validators:
     @staticmethod
     def validate_github_date(date_str: str) -> bool:
         try:
-            if date_str.endswith('Z'):
-                date_str = date_str.replace('Z', '+00:00')
-            datetime.fromisoformat(date_str)
+            Helpers.parse_github_date(date_str)
             return True
         except Exception as e:
             print(e)